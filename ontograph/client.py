@@ -348,6 +348,7 @@ class ClientOntology:
         downloader: DownloaderPort | str | None = None,
         include_obsolete: bool = False,
         backend: str = 'pronto',
+        build_indexes: bool = False,
     ) -> None:
         """Load an ontology from a file path, URL, or OBO Foundry catalog.
 
@@ -364,6 +365,7 @@ class ClientOntology:
                 ('pooch' or 'download_manager'). Defaults to None.
             include_obsolete (bool, optional): If True, include obsolete terms when building GraphBLAS structures. Defaults to False.
             backend (str, optional): Backend for queries ('pronto' or 'graphblas'). Defaults to 'pronto'.
+            build_indexes (bool, optional): If True, call `build_indexes` once loaded. Defaults to False.
 
         Raises:
             FileNotFoundError: If the ontology source cannot be found as a file, URL, or catalog entry.
@@ -461,6 +463,8 @@ class ClientOntology:
         # Initialize queries
         logger.info('Initialize queries sequence.')
         self._initialize_queries(backend)
+        if build_indexes:
+            self.build_indexes()
 
         logger.info('Ontology loading complete.')
         logger.info('--- Ontology load session end ---')
@@ -496,6 +500,38 @@ class ClientOntology:
                 lookup_tables=self._lookup_tables,
             )
 
+    def build_indexes(self, distance_table: bool = False) -> None:
+        """Precompute lookups that speed up repeated relation queries.
+
+        Builds the ancestry bitsets behind `is_ancestor`, `is_descendant`,
+        `is_sibling` and `get_common_ancestors` and, optionally, the ancestor
+        distance table behind `get_lowest_common_ancestors` and
+        `get_distance_from_root`. Their memory grows with the square of the
+        number of terms, so they are opt-in. Only the 'pronto' backend has
+        these indexes; with 'graphblas' this does nothing.
+
+        Args:
+            distance_table (bool, optional): Also build the ancestor distance table. Defaults to False.
+
+        Raises:
+            RuntimeError: If ontology not loaded.
+            ValueError: If the ``is_a`` hierarchy contains a cycle, or the ontology is too large for the distance table.
+
+        Example:
+            >>> client = ClientOntology()
+            >>> client.load(source="./tests/resources/dummy_ontology.obo")
+            >>> client.build_indexes(distance_table=True)
+        """
+        if self._relations is None:
+            raise RuntimeError('Ontology not loaded. Call `load()` first.')
+        if not isinstance(self._relations, RelationsPronto):
+            logger.info('No precomputed indexes for this backend.')
+            return
+
+        self._relations.build_ancestry_index()
+        if distance_table:
+            self._relations.build_distance_table()
+
     @property
     def _get_ontology(self) -> Ontology:
         """Access the loaded ontology.
@@ -12,6 +12,9 @@ __all__ = [
     'SUPPORTED_FORMATS_ONTOGRAPH',
     'DEFAULT_FORMAT_ONTOLOGY',
     'DEFAULT_DOWNLOADER',
+    'DOWNLOAD_CHUNK_SIZE',
+    'DOWNLOAD_MAX_WORKERS',
+    'DOWNLOAD_TIMEOUT',
 ]
 
 # Package metadata from installed package
@@ -36,3 +39,11 @@ DEFAULT_FORMAT_ONTOLOGY = 'obo'
 DEFAULT_DOWNLOADER = 'pooch'
 
 # TODO: Ready for improvement
+
+# Streaming parameters for HTTP downloads: bytes written per chunk and
+# (connect, read) timeouts in seconds
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_TIMEOUT = (5, 120)
+
+# Concurrent downloads per catalog batch
+DOWNLOAD_MAX_WORKERS = 4
@@ -4,15 +4,27 @@ This module defines abstract interfaces and concrete implementations for
 downloading ontology resources from both direct URLs and ontology catalogs.
 """
 
+import os
 from abc import ABC, abstractmethod
+import shutil
 from typing import TYPE_CHECKING
+import hashlib
 import logging
 from pathlib import Path
+import operator
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
-from pooch import retrieve
+from pooch import HTTPDownloader, retrieve
 import requests
 
-from ontograph.config.settings import DEFAULT_FORMAT_ONTOLOGY
+from ontograph.config.settings import (
+    DOWNLOAD_TIMEOUT,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_MAX_WORKERS,
+    DEFAULT_FORMAT_ONTOLOGY,
+)
 
 if TYPE_CHECKING:
     from ontograph.models import CatalogOntologies
@@ -28,6 +40,9 @@ __all__ = [
     'get_default_downloader',
 ]
 
+_GET_NAME_ID = operator.itemgetter('name_id')
+_MISSING_NAME_ID = "Resource dictionary must contain 'name_id' key"
+
 
 # -------------------------------------------------
 # ----     Downloader Port (abstract class)    ----
@@ -39,13 +54,18 @@ class DownloaderPort(ABC):
     or catalogs.
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    def fetch_from_url(self, url_ontology: str, filename: str | None) -> Path:
+    def fetch_from_url(
+        self, url_ontology: str, filename: str | None, *, force: bool = False
+    ) -> Path:
         """Download an ontology file from a specified URL.
 
         Args:
             url_ontology: URL pointing to the ontology file
             filename: Name to save the file as
+            force: Download again even if a cached copy exists
 
         Returns:
             Path: Path to the downloaded file
@@ -127,30 +147,57 @@ class PoochDownloaderAdapter(DownloaderPort):
     Downloads and caches ontology files using the Pooch library.
     """
 
-    def __init__(self, cache_dir: Path) -> None:
+    __slots__ = (
+        '_bg',
+        '_cache_dir',
+        '_lock',
+        '_max_workers',
+        '_objects_dir',
+        '_resources_paths',
+    )
+
+    def __init__(
+        self, cache_dir: Path, max_workers: int = DOWNLOAD_MAX_WORKERS
+    ) -> None:
         """Initialize the Pooch downloader.
 
         Args:
             cache_dir: Directory to store downloaded files
+            max_workers: Maximum concurrent downloads per catalog batch
         """
         self._cache_dir = Path(cache_dir)
         self._resources_paths: dict[str, Path] = {}
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()  # Guards _resources_paths
+        self._max_workers = max_workers
+        # Downloads are stored once per URL under objects/<sha256 of URL>
+        self._objects_dir = self._cache_dir / 'objects'
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+        # Background pool for prefetch(), created on first use
+        self._bg: ThreadPoolExecutor | None = None
 
     def get_paths(self) -> dict[str, Path]:
         """Get paths of all downloaded resources.
 
         Returns:
-            dict[str, Path]: dictionary mapping resource IDs to file paths
+            dict[str, Path]: snapshot mapping resource IDs to file paths
         """
-        return self._resources_paths
+        with self._lock:
+            return dict(self._resources_paths)
 
-    def fetch_from_url(self, url_ontology: str, filename: str | None) -> Path:
+    def fetch_from_url(
+        self, url_ontology: str, filename: str | None, *, force: bool = False
+    ) -> Path:
         """Download an ontology file from a specified URL.
 
+        Files are cached by URL, so fetching a URL that was already
+        downloaded, even under another filename, does not hit the network.
+        Deleting the file from ``cache_dir`` does not drop the cached copy;
+        pass ``force`` to download a URL whose content has changed.
+
         Args:
             url_ontology: URL pointing to the ontology file
             filename: Name to save the file as
+            force: Drop the cached copy of the URL and download it again
 
         Returns:
             Path: Path to the downloaded file
@@ -160,12 +207,25 @@ class PoochDownloaderAdapter(DownloaderPort):
             RequestException: If the download fails
             IOError: If saving the file fails
         """
+        return self._fetch(url_ontology, filename, force=force)
+
+    def _fetch(
+        self,
+        url_ontology: str,
+        filename: str | None,
+        *,
+        force: bool = False,
+        progressbar: bool = True,
+    ) -> Path:
         self._validate_download_parameters(url_ontology, filename)
 
         logger.info('Download start: %s -> %s', url_ontology, filename)
         try:
-            result_path = self._perform_download(url_ontology, filename)
-            self._resources_paths[filename.split('.')[0]] = result_path
+            result_path = self._perform_download(
+                url_ontology, filename, force=force, progressbar=progressbar
+            )
+            with self._lock:
+                self._resources_paths[filename.split('.')[0]] = result_path
             logger.debug('Download success: %s', result_path)
             return result_path
         except requests.RequestException as e:
@@ -184,18 +244,61 @@ class PoochDownloaderAdapter(DownloaderPort):
         if not filename or not filename.strip():
             raise ValueError('Filename cannot be empty')
 
-    def _perform_download(self, url_ontology: str, filename: str) -> Path:
-        resource_path = retrieve(
+    def _build_http_downloader(
+        self, url_ontology: str, progressbar: bool = True
+    ) -> HTTPDownloader | None:
+        # Pooch streams HTTP bodies to disk chunk by chunk; its default 1 KiB
+        # chunk makes multi-hundred-MB ontologies loop in Python per KiB.
+        if not url_ontology.lower().startswith(('http://', 'https://')):
+            return None  # Let pooch choose the FTP/SFTP/DOI downloader
+
+        return HTTPDownloader(
+            progressbar=progressbar,
+            chunk_size=DOWNLOAD_CHUNK_SIZE,
+            timeout=DOWNLOAD_TIMEOUT,
+        )
+
+    def _perform_download(
+        self,
+        url_ontology: str,
+        filename: str,
+        *,
+        force: bool = False,
+        progressbar: bool = True,
+    ) -> Path:
+        # Pooch skips the download when the object already exists and
+        # writes new ones through a temporary file, so objects are atomic.
+        key = hashlib.sha256(url_ontology.encode()).hexdigest()
+        if force:
+            (self._objects_dir / key).unlink(missing_ok=True)
+        object_path = retrieve(
             url=url_ontology,
             known_hash=None,  # TODO: Could later integrate SHA256 checksums
-            fname=filename,
-            path=self._cache_dir,
-            progressbar=True,
+            fname=key,
+            path=self._objects_dir,
+            downloader=self._build_http_downloader(url_ontology, progressbar),
+            progressbar=progressbar,
         )
-        result_path = Path(resource_path)
+        result_path = self._link_object(Path(object_path), filename)
         logger.debug('Download success: %s', result_path)
         return result_path
 
+    def _link_object(self, object_path: Path, filename: str) -> Path:
+        target = self._cache_dir / filename
+        # Unique per process and thread; a link left by a crashed run with
+        # the same name is stale, so it is cleared before linking again
+        staging = target.with_name(
+            f'.{filename}.{os.getpid()}.{threading.get_ident()}'
+        )
+        staging.unlink(missing_ok=True)
+        try:
+            staging.symlink_to(Path(self._objects_dir.name, object_path.name))
+        except (NotImplementedError, PermissionError):
+            # No symlink support (e.g. unprivileged Windows)
+            shutil.copyfile(object_path, staging)
+        os.replace(staging, target)
+        return target
+
     def fetch_from_catalog(
         self,
         resources: list[dict[str, str]],
@@ -218,31 +321,182 @@ class PoochDownloaderAdapter(DownloaderPort):
             raise ValueError('Resources list for batch download is empty.')
 
         logger.debug('Catalog batch download: %s items', len(resources))
-        results = {}
-        for resource in resources:
-            name_id, format_type = self._extract_resource_info(resource)
-            url = self._get_resource_url(name_id, format_type, catalog)
+        # Leaving the executor waits for every submitted download, so files
+        # fetched before a failure are still recorded in the resource paths.
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix='ontograph-download',
+        ) as executor:
+            futures = {
+                name_id: executor.submit(
+                    # Concurrent progress bars overwrite each other
+                    self._fetch,
+                    url_ontology=url,
+                    filename=filename,
+                    progressbar=False,
+                )
+                for name_id, url, filename in self._iter_resolved(
+                    resources, catalog
+                )
+            }
+            results = {
+                name_id: future.result() for name_id, future in futures.items()
+            }
+
+        self._verify_batch(results)
+        with self._lock:
+            self._resources_paths.update(results)
+        return results
 
-            filename = f'{name_id}.{format_type}'
-            local_path = self.fetch_from_url(
-                url_ontology=url, filename=filename
+    def _verify_batch(self, results: dict[str, Path]) -> dict[str, Path]:
+        # One directory listing per target folder instead of a stat per file
+        present: dict[Path, set[str]] = {}
+        for parent in {path.parent for path in results.values()}:
+            with os.scandir(parent) as entries:
+                present[parent] = {entry.name for entry in entries}
+
+        missing = [
+            name_id
+            for name_id, path in results.items()
+            if path.name not in present[path.parent]
+        ]
+        if missing:
+            raise FileNotFoundError(
+                f'Downloaded files not found for: {", ".join(missing)}'
             )
-            results[name_id] = local_path
-
-        self._resources_paths.update(results)
         return results
 
+    def prefetch(
+        self,
+        resources: list[dict[str, str]],
+        catalog: 'CatalogOntologies',
+    ) -> 'Future[dict[str, Path]]':
+        """Start downloading a catalog batch in the background.
+
+        Args:
+            resources: list of dictionaries with resource information
+            catalog: Catalog object containing download URLs
+
+        Returns:
+            Future[dict[str, Path]]: future resolving to the same mapping
+            as ``fetch_from_catalog``
+        """
+        with self._lock:
+            if self._bg is None:
+                self._bg = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix='ontograph-prefetch',
+                )
+            executor = self._bg
+        return executor.submit(self.fetch_from_catalog, resources, catalog)
+
+    def close(self) -> None:
+        """Shut down the background pool used by ``prefetch``.
+
+        Waits for prefetches already running; a later ``prefetch`` starts a
+        new pool.
+        """
+        with self._lock:
+            executor, self._bg = self._bg, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'PoochDownloaderAdapter':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def iter_fetched(
+        self,
+        resources: list[dict[str, str]],
+        catalog: 'CatalogOntologies',
+    ) -> Iterator[tuple[str, Path]]:
+        """Download a catalog batch, yielding each file as soon as it is ready.
+
+        Args:
+            resources: list of dictionaries with resource information
+            catalog: Catalog object containing download URLs
+
+        Returns:
+            Iterator[tuple[str, Path]]: resource ID and path pairs, in
+            completion order. Closing it early cancels queued downloads.
+
+        Raises:
+            ValueError: If the resources list is empty or URL not found
+            KeyError: If a resource is missing required fields
+        """
+        # Validate and resolve eagerly, so errors surface on the call rather
+        # than on the first next()
+        if not resources:
+            raise ValueError('Resources list for batch download is empty.')
+        jobs = list(self._iter_resolved(resources, catalog))
+        return self._iter_completed(jobs)
+
+    def _iter_completed(
+        self, jobs: list[tuple[str, str, str]]
+    ) -> Iterator[tuple[str, Path]]:
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix='ontograph-download',
+        )
+        try:
+            futures = {
+                executor.submit(
+                    # Concurrent progress bars overwrite each other
+                    self._fetch,
+                    url_ontology=url,
+                    filename=filename,
+                    progressbar=False,
+                ): name_id
+                for name_id, url, filename in jobs
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Stopping early drops queued downloads and does not block on
+            # the ones already running
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_resolved(
+        self,
+        resources: list[dict[str, str]],
+        catalog: 'CatalogOntologies',
+    ) -> Iterator[tuple[str, str, str]]:
+        name_ids, format_types = self._extract_batch(resources)
+        for name_id, format_type in zip(name_ids, format_types, strict=True):
+            url = self._get_resource_url(name_id, format_type, catalog)
+            yield name_id, url, f'{name_id}.{format_type}'
+
     def _extract_resource_info(
         self, resource: dict[str, str]
     ) -> tuple[str, str]:
-        name_id = resource.get('name_id')
+        try:
+            name_id = _GET_NAME_ID(resource)
+        except KeyError:
+            raise KeyError(_MISSING_NAME_ID) from None
         if not name_id:
-            raise KeyError("Resource dictionary must contain 'name_id' key")
+            raise KeyError(_MISSING_NAME_ID)
+
+        # Default to OBO format
+        return name_id, resource.get('format', DEFAULT_FORMAT_ONTOLOGY)
 
-        format_type = resource.get(
-            'format', DEFAULT_FORMAT_ONTOLOGY
-        )  # Default to OBO format
-        return name_id, format_type
+    def _extract_batch(
+        self, resources: list[dict[str, str]]
+    ) -> tuple[list[str], list[str]]:
+        # Validate every resource up front, before any download starts
+        try:
+            name_ids = [_GET_NAME_ID(resource) for resource in resources]
+        except KeyError:
+            raise KeyError(_MISSING_NAME_ID) from None
+        if not all(name_ids):
+            raise KeyError(_MISSING_NAME_ID)
+
+        format_types = [
+            resource.get('format', DEFAULT_FORMAT_ONTOLOGY)
+            for resource in resources
+        ]
+        return name_ids, format_types
 
     def _get_resource_url(
         self, name_id: str, format_type: str, catalog: 'CatalogOntologies'
@@ -304,12 +558,15 @@ class DownloadManagerAdapter(DownloaderPort):
         """
         return self._resources_paths
 
-    def fetch_from_url(self, url_ontology: str, filename: str | None) -> Path:
+    def fetch_from_url(
+        self, url_ontology: str, filename: str | None, *, force: bool = False
+    ) -> Path:
         """Download an ontology file from a specified URL.
 
         Args:
             url_ontology: URL pointing to the ontology file
             filename: Name to save the file as
+            force: Remove an existing copy of the file and download it again
 
         Returns:
             Path: Path to the downloaded file
@@ -322,6 +579,8 @@ class DownloadManagerAdapter(DownloaderPort):
         self._validate_download_parameters(url_ontology, filename)
 
         dest = self._cache_dir / filename
+        if force:
+            dest.unlink(missing_ok=True)
         logger.info('Download start: %s -> %s', url_ontology, dest)
         result_path = self._manager.download(url_ontology, dest=str(dest))
         if not result_path:
@@ -380,14 +639,15 @@ class DownloadManagerAdapter(DownloaderPort):
     def _extract_resource_info(
         self, resource: dict[str, str]
     ) -> tuple[str, str]:
-        name_id = resource.get('name_id')
+        try:
+            name_id = _GET_NAME_ID(resource)
+        except KeyError:
+            raise KeyError(_MISSING_NAME_ID) from None
         if not name_id:
-            raise KeyError("Resource dictionary must contain 'name_id' key")
+            raise KeyError(_MISSING_NAME_ID)
 
-        format_type = resource.get(
-            'format', DEFAULT_FORMAT_ONTOLOGY
-        )  # Default to OBO format
-        return name_id, format_type
+        # Default to OBO format
+        return name_id, resource.get('format', DEFAULT_FORMAT_ONTOLOGY)
 
     def _get_resource_url(
         self, name_id: str, format_type: str, catalog: 'CatalogOntologies'
@@ -5,9 +5,12 @@ from files, catalogs, and URLs. It supports adapters for different ontology
 formats and integrates with downloader and catalog utilities.
 """
 
+import os
 import re
 from abc import ABC, abstractmethod
+import pickle  # nosec B403 - only unpickles files this adapter wrote
 from typing import Any
+import hashlib
 import logging
 from pathlib import Path
 import tempfile
@@ -100,18 +103,24 @@ class ProntoLoaderAdapter(OntologyLoaderPort):
         self,
         cache_dir: str | Path | None = None,
         downloader: DownloaderPort | None = None,
+        pickle_cache: bool = False,
     ) -> None:
         """Initialize the ProntoLoaderAdapter.
 
         Args:
             cache_dir (str | Path | None, optional): Directory for cached files. Defaults to None.
             downloader (DownloaderPort | None, optional): Downloader adapter for remote resources. Defaults to None.
+            pickle_cache (bool, optional): Keep a pickle of each parsed ontology
+                in ``cache_dir`` and load it instead of re-parsing the same
+                file. Only enable it for a cache directory you trust.
+                Defaults to False.
         """
         self._cache_dir: Path | None = (
             Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
         )
         self._ontology: Ontology | None = None
         self._downloader: DownloaderPort | None = downloader
+        self._pickle_cache: bool = pickle_cache
 
     @cached_property
     def catalog(self) -> CatalogOntologies:
@@ -248,6 +257,78 @@ class ProntoLoaderAdapter(OntologyLoaderPort):
             )
             return path_file
 
+    def _pickle_path(self, path_file: Path) -> Path:
+        """Return the pickle cache path for an ontology file.
+
+        The name is keyed on the file content and the pronto version, so an
+        edited file or a pronto upgrade never picks up a stale pickle.
+
+        Args:
+            path_file (Path): Path to the ontology file.
+
+        Returns:
+            Path: Path of the pickle inside the cache directory.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        digest.update(pronto.__version__.encode())
+        return self.cache_dir / f'{path_file.stem}.{digest.hexdigest()}.pkl'
+
+    def _read_pickle(self, pickle_path: Path) -> pronto.Ontology | None:
+        """Load a cached ontology pickle.
+
+        Args:
+            pickle_path (Path): Path to the pickle file.
+
+        Returns:
+            pronto.Ontology | None: The cached ontology, or None if the pickle
+            is missing or unreadable.
+        """
+        try:
+            with open(pickle_path, 'rb') as f:
+                return pickle.load(f)  # nosec B301 - written by _write_pickle
+        except FileNotFoundError:
+            return None
+        except (
+            OSError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            pickle.UnpicklingError,
+        ) as e:
+            logger.warning(f'Ignoring unreadable pickle {pickle_path}: {e}')
+            return None
+
+    def _write_pickle(
+        self, ontology: pronto.Ontology, pickle_path: Path
+    ) -> None:
+        """Store a parsed ontology as a pickle.
+
+        The pickle is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial file.
+
+        Args:
+            ontology (pronto.Ontology): Parsed ontology.
+            pickle_path (Path): Destination of the pickle file.
+        """
+        staging: str | None = None
+        try:
+            payload = pickle.dumps(ontology, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=pickle_path.parent, suffix='.tmp', delete=False
+            ) as f:
+                staging = f.name
+                f.write(payload)
+            os.replace(staging, pickle_path)
+            logger.debug(f'Cached parsed ontology at: {pickle_path}')
+        except (OSError, TypeError, AttributeError, pickle.PicklingError) as e:
+            logger.warning(f'Failed to cache ontology at {pickle_path}: {e}')
+            if staging is not None:
+                Path(staging).unlink(missing_ok=True)
+
     def _load_ontology(
         self, path_file: Path
     ) -> tuple[pronto.Ontology, str | None]:
@@ -269,6 +350,14 @@ class ProntoLoaderAdapter(OntologyLoaderPort):
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
 
+        pickle_path: Path | None = None
+        if self._pickle_cache:
+            pickle_path = self._pickle_path(path_file)
+            cached = self._read_pickle(pickle_path)
+            if cached is not None:
+                logger.debug(f'Loaded ontology from pickle: {pickle_path}')
+                return cached, self._extract_ontology_id(cached)
+
         # Fix malformed dates if needed
         fixed_path = self._fix_malformed_dates(path_file)
 
@@ -317,6 +406,9 @@ class ProntoLoaderAdapter(OntologyLoaderPort):
                     f'Failed to clean up temporary file {fixed_path}: {e}'
                 )
 
+        if pickle_path is not None:
+            self._write_pickle(ontology, pickle_path)
+
         return ontology, ontology_id
 
     def _create_ontology_object(
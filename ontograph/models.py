@@ -1,8 +1,11 @@
 import re
+import sys
 import pprint
 from typing import TYPE_CHECKING
+import inspect
 import logging
 from pathlib import Path
+from functools import lru_cache
 from dataclasses import dataclass
 
 from tqdm import tqdm
@@ -27,6 +30,26 @@ __all__ = ['CatalogOntologies', 'Ontology']
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _separators_pattern(separators: tuple) -> re.Pattern:
+    """Compile, once per separator tuple, a pattern matching any of them."""
+    return re.compile('|'.join(map(re.escape, separators)))
+
+
+def _accepts_keyword(function: object, name: str) -> bool:
+    """Return whether ``function`` can be called with keyword ``name``."""
+    try:
+        parameters = inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in parameters or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+    )
+
 
 # ---------------------------------------------------------------- #
 # --------- CLASSES related to the catalog of ontologies --------- #
@@ -56,10 +79,16 @@ class CatalogOntologies:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _download_registry(
-        self, downloader: 'DownloaderPort | None' = None
+        self,
+        downloader: 'DownloaderPort | None' = None,
+        force: bool = False,
     ) -> Path:
         """Download the latest catalog file.
 
+        Args:
+            downloader (DownloaderPort | None, optional): Downloader implementation. Defaults to None.
+            force (bool, optional): Download again even if the downloader has a cached copy. Defaults to False.
+
         Returns:
             Path: Path to the downloaded catalog file.
         """
@@ -72,9 +101,17 @@ class CatalogOntologies:
 
         logger.info('Catalog download start: %s', OBO_FOUNDRY_REGISTRY_URL)
         logger.debug('Catalog download target: %s', catalog_path)
+        # Downloaders written before `force` existed take two arguments;
+        # only pass it when a refresh is requested and they can take it
+        options = (
+            {'force': True}
+            if force and _accepts_keyword(downloader.fetch_from_url, 'force')
+            else {}
+        )
         downloader.fetch_from_url(
             url_ontology=OBO_FOUNDRY_REGISTRY_URL,
             filename=NAME_OBO_FOUNDRY_CATALOG,
+            **options,
         )
         return catalog_path
 
@@ -92,10 +129,12 @@ class CatalogOntologies:
         catalog_path = self.cache_dir / NAME_OBO_FOUNDRY_CATALOG
 
         if force_download or not catalog_path.exists():
-            catalog_path = self._download_registry(downloader=downloader)
+            catalog_path = self._download_registry(
+                downloader=downloader, force=force_download
+            )
 
-        with open(catalog_path) as f:
-            self._catalog = yaml.safe_load(f)
+        with open(catalog_path, 'rb') as f:
+            self._catalog = yaml.load(f, Loader=_YAML_LOADER)  # nosec B506
 
         return None
 
@@ -311,16 +350,25 @@ class Ontology:
 
 class LookUpTables:
     def __init__(self, terms: list) -> None:
-        self.__lut_term_to_index: dict[str, int] = {
-            term.id: idx for idx, term in enumerate(terms)
-        }
-        self.__lut_index_to_term: list[str] = [term.id for term in terms]
-        self.__lut_term_to_description: dict[str, str] = {
-            term.id: term.name for term in terms
-        }
-        self.__lut_description_to_term: dict[str, str] = {
-            term.name: term.id for term in terms
-        }
+        # Read each attribute once, then let dict(zip()) build the tables;
+        # IDs are interned as they key every lookup table below
+        term_ids = [sys.intern(term.id) for term in terms]
+        term_names = [term.name for term in terms]
+
+        self.__lut_term_to_index: dict[str, int] = dict(
+            zip(term_ids, range(len(term_ids)), strict=True)
+        )
+        self.__lut_index_to_term: list[str] = term_ids
+        # Object array view of the same IDs for vectorized index lookups
+        self.__index_to_term_array: np.ndarray = np.array(
+            self.__lut_index_to_term, dtype=object
+        )
+        self.__lut_term_to_description: dict[str, str] = dict(
+            zip(term_ids, term_names, strict=True)
+        )
+        self.__lut_description_to_term: dict[str, str] = dict(
+            zip(term_names, term_ids, strict=True)
+        )
 
     def get_lut_term_to_index(self) -> dict[str, int]:
         return self.__lut_term_to_index
@@ -338,15 +386,23 @@ class LookUpTables:
         if isinstance(terms, str):
             return self.__lut_term_to_index[terms]
         elif isinstance(terms, list):
-            return [self.__lut_term_to_index[term] for term in terms]
+            # map() over the bound lookup runs the loop in C
+            return list(map(self.__lut_term_to_index.__getitem__, terms))
 
     def index_to_term(self, indexes: int | list) -> str | list:
         if isinstance(indexes, int):
             return self.__lut_index_to_term[indexes]
-        elif isinstance(indexes, list):
-            return [self.__lut_index_to_term[idx] for idx in indexes]
-        elif isinstance(indexes, np.ndarray):
-            return [self.__lut_index_to_term[idx] for idx in indexes.tolist()]
+        elif isinstance(indexes, (list, np.ndarray)):
+            positions = np.asarray(indexes)
+            # Empty lists come out as float64; anything else must be integral
+            # so floats are rejected rather than silently truncated
+            if positions.size and positions.dtype.kind not in 'iu':
+                raise TypeError(
+                    f'Expected integer indexes, got dtype {positions.dtype}.'
+                )
+            return self.__index_to_term_array.take(
+                positions.astype(np.intp, copy=False)
+            ).tolist()
         else:
             raise TypeError(
                 f'Expected int, list[int], or np.ndarray, got {type(indexes).__name__}.'
@@ -356,15 +412,15 @@ class LookUpTables:
         if isinstance(terms, str):
             return self.__lut_term_to_description[terms]
         elif isinstance(terms, list):
-            return [self.__lut_term_to_description[term] for term in terms]
+            return list(map(self.__lut_term_to_description.__getitem__, terms))
 
     def description_to_term(self, descriptions: str | list) -> str | list:
         if isinstance(descriptions, str):
             return self.__lut_description_to_term[descriptions]
         elif isinstance(descriptions, list):
-            return [
-                self.__lut_description_to_term[term] for term in descriptions
-            ]
+            return list(
+                map(self.__lut_description_to_term.__getitem__, descriptions)
+            )
 
 
 @dataclass
@@ -400,9 +456,8 @@ class NodesDataframe:
     def __get_last_part_string(
         self, s: str, separators: tuple = ('/', ':', '.', '#')
     ) -> str:
-        # Create a regex pattern to split by any of the separators
-        pattern = '|'.join(map(re.escape, separators))
-        parts = re.split(pattern, s)
+        # Split by any of the separators
+        parts = _separators_pattern(separators).split(s)
 
         return parts[-1] if parts else s
 
@@ -559,121 +614,130 @@ class EdgesContainer:
         )
         self.relations = list(self.edges_indices.keys())
 
-    # Search all possible relations in the ontology
-    def _get_ontology_relationships(self, terms: list) -> list:
-        set_relations = set()
-        for term in terms:
-            for rel in term.relationships:
-                rel_name = rel.name.lower().replace(' ', '_')
-                set_relations.add(rel_name)
-        return sorted(set_relations)
-
-    # Create empty containers for each relation type
-    def _create_edges_index_containers(self, terms: list) -> dict:
-        relationships = self._get_ontology_relationships(terms)
-
-        # Always include 'is_a' relationship
-        relationships.append('is_a')
-        edge_container = {
-            rel: {'rows': [], 'cols': []} for rel in relationships
-        }
-        return edge_container
-
-    # Populate the containers with row and column indices
+    # Populate row and column indices for every relation in one pass
     def _populate_index_containers(
         self, terms: list, lookup_tables: LookUpTables
     ) -> dict:
-        edge_container = self._create_edges_index_containers(terms)
+        term_to_index = lookup_tables.get_lut_term_to_index()
+        edges = {'is_a': ([], [])}
+        relationships = set()
+        is_a_rows, is_a_cols = edges['is_a']
         for term in tqdm(terms, desc='Building edge containers', unit='term'):
+            term_index = term_to_index[term.id]
             # Populate 'is_a' relationships
             for subclass in term.subclasses(with_self=False, distance=1):
                 if subclass.obsolete:
                     continue
-                rel_name = 'is_a'
-                edge_container[rel_name]['rows'].append(
-                    lookup_tables.term_to_index(subclass.id)
-                )
-                edge_container[rel_name]['cols'].append(
-                    lookup_tables.term_to_index(term.id)
-                )
+                is_a_rows.append(term_to_index[subclass.id])
+                is_a_cols.append(term_index)
 
             # Populate other relationships
             for rel, targets in term.relationships.items():
                 rel_name = rel.name.lower().replace(' ', '_')
+                relationships.add(rel_name)
+                rows, cols = edges.setdefault(rel_name, ([], []))
                 for target in targets:
                     if target.obsolete:
                         continue
-                    edge_container[rel_name]['rows'].append(
-                        lookup_tables.term_to_index(term.id)
-                    )
-                    edge_container[rel_name]['cols'].append(
-                        lookup_tables.term_to_index(target.id)
-                    )
-
-        # Convert lists to numpy arrays with dtype np.int64
-        for _rel, data in edge_container.items():
-            data['rows'] = np.array(data['rows'], dtype=np.int64)
-            data['cols'] = np.array(data['cols'], dtype=np.int64)
+                    rows.append(term_index)
+                    cols.append(term_to_index[target.id])
+
+        # Relations sorted by name, always including 'is_a'; lists become
+        # numpy arrays with dtype np.int64
+        order = sorted(relationships)
+        order.append('is_a')
+        edge_container = {}
+        for rel_name in order:
+            if rel_name in edge_container:
+                continue
+            rows, cols = edges[rel_name]
+            edge_container[rel_name] = {
+                'rows': np.array(rows, dtype=np.int64),
+                'cols': np.array(cols, dtype=np.int64),
+            }
         return edge_container
 
 
 class EdgesDataframe:
     def __init__(
-        self, terms: pronto.Term, include_obsolete: bool = False
+        self,
+        terms: pronto.Term,
+        include_obsolete: bool = False,
+        categorical_relations: bool = False,
     ) -> None:
         self.dataframe = self.create_edges_dataframe(
-            terms, include_obsolete=include_obsolete
+            terms,
+            include_obsolete=include_obsolete,
+            categorical_relations=categorical_relations,
         )
 
     def __get_last_part_string(
         self, input_string: str, separators: tuple = ('/', ':', '.', '#')
     ) -> str:
-        pattern = '|'.join(map(re.escape, separators))
-        parts = re.split(pattern, input_string)
+        parts = _separators_pattern(separators).split(input_string)
         return parts[-1] if parts else input_string
 
     def create_edges_dataframe(
-        self, terms: list, include_obsolete: bool = False
+        self,
+        terms: list,
+        include_obsolete: bool = False,
+        categorical_relations: bool = False,
     ) -> 'pd.DataFrame':
-        """Create a DataFrame with fields: source_id, source_name, relation, target_id, target_name, is_obsolete."""
-        rows = []
+        """Create a DataFrame with fields: source_id, source_name, relation, target_id, target_name, is_obsolete.
+
+        An ontology has only a handful of relation names; pass
+        ``categorical_relations=True`` to store the ``relation`` column as a
+        categorical of integer codes instead of plain strings.
+        """
+        # Fill one list per column; pandas builds each column in one pass
+        source_ids = []
+        source_names = []
+        relations = []
+        target_ids = []
+        target_names = []
+        obsolete = []
+
+        def add_edge(
+            source: pronto.Term,
+            relation: str,
+            target: pronto.Term,
+            is_obsolete: bool,
+        ) -> None:
+            source_ids.append(source.id)
+            source_names.append(source.name)
+            relations.append(relation)
+            target_ids.append(target.id)
+            target_names.append(target.name)
+            obsolete.append(is_obsolete)
+
         for term in tqdm(terms, desc='Building edge dataframe', unit='term'):
             if not include_obsolete and term.obsolete:
                 continue
-            source_id = term.id
-            source_name = term.name
             for rel, targets in term.relationships.items():
                 rel_name = rel.name
                 for target in targets:
-                    rows.append(
-                        {
-                            'source_id': source_id,
-                            'source_name': source_name,
-                            'relation': rel_name,
-                            'target_id': target.id,
-                            'target_name': target.name,
-                            'is_obsolete': target.obsolete,
-                        }
-                    )
+                    add_edge(term, rel_name, target, target.obsolete)
             # Add is_a relationships (subclasses)
             for subclass in term.subclasses(with_self=False, distance=1):
                 if not include_obsolete and subclass.obsolete:
                     continue
-                rows.append(
-                    {
-                        'source_id': subclass.id,
-                        'source_name': subclass.name,
-                        'relation': 'is_a',
-                        'target_id': term.id,
-                        'target_name': term.name,
-                        'is_obsolete': subclass.obsolete,
-                    }
-                )
+                add_edge(subclass, 'is_a', term, subclass.obsolete)
 
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame(
+            {
+                'source_id': source_ids,
+                'source_name': source_names,
+                'relation': relations,
+                'target_id': target_ids,
+                'target_name': target_names,
+                'is_obsolete': obsolete,
+            }
+        )
         df.sort_values(['source_id', 'relation', 'target_id'], inplace=True)
         df.reset_index(drop=True, inplace=True)
         df.insert(0, 'index', range(len(df)))
+        if categorical_relations:
+            df['relation'] = df['relation'].astype('category')
         return df
 
 
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+import sys
 import logging
-from collections import deque
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from collections.abc import Iterator
 
 import numpy as np
@@ -10,11 +12,34 @@ from ontograph.models import Ontology, LookUpTables
 
 __all__ = [
     'NavigatorOntology',
+    'TermIndex',
 ]
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Most recent ancestor/descendant queries kept per navigator
+_TRAVERSAL_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class TermIndex:
+    """Integer view of the ontology's ``is_a`` hierarchy.
+
+    Attributes:
+        ids (list[str]): Term IDs, indexed by position.
+        positions (dict[str, int]): Position of each term ID in ``ids``.
+        parents (list[tuple[int, ...]]): Positions of each term's direct
+            parents.
+    """
+
+    ids: list[str]
+    positions: dict[str, int]
+    parents: list[tuple[int, ...]]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
 
 # --------------------------------------------------------
 # ----     OntologyNavigator Port (abstract class)    ----
@@ -108,6 +133,79 @@ class NavigatorPronto(NavigatorOntology):
             ontology (Ontology): An Ontology object containing the loaded ontology data.
         """
         self.__ontology = ontology.get_ontology()
+        self.__index = None
+        # Bounded LRU caches of traversal results; see clear_cache()
+        self.__ancestors_cache: OrderedDict[tuple, tuple[str, ...]] = (
+            OrderedDict()
+        )
+        self.__descendants_cache: OrderedDict[tuple, frozenset[str]] = (
+            OrderedDict()
+        )
+
+    @property
+    def index(self) -> TermIndex | None:
+        """The term index built by `build_index`, or None if not built yet."""
+        return self.__index
+
+    def clear_cache(self) -> None:
+        """Drop cached ancestor and descendant results and the term index.
+
+        Call this after modifying the wrapped ontology; cached traversals
+        would otherwise keep answering from the old hierarchy. Indexes
+        built from it by `RelationsPronto.build_ancestry_index` and
+        `RelationsPronto.build_distance_table` are not reset here and must
+        be rebuilt as well.
+        """
+        self.__ancestors_cache.clear()
+        self.__descendants_cache.clear()
+        self.__index = None
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: tuple) -> object:
+        value = cache.pop(key, None)
+        if value is not None:
+            cache[key] = value  # Re-insert as most recently used
+        return value
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: tuple, value: object) -> None:
+        cache[key] = value
+        if len(cache) > _TRAVERSAL_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def build_index(self) -> TermIndex:
+        """Index every term and its direct parents by integer position.
+
+        The index is built once and reused; it is the base for the opt-in
+        precomputed lookups in the relations and introspection adapters.
+
+        Returns:
+            TermIndex: The integer view of the ontology hierarchy.
+        """
+        if self.__index is not None:
+            return self.__index
+
+        ids = []
+        parent_ids = []
+        for term in self.__ontology.terms():
+            # Interned IDs let dict and set lookups with the same literal
+            # short-circuit on identity before comparing characters
+            ids.append(sys.intern(term.id))
+            parent_ids.append(
+                [
+                    parent.id
+                    for parent in term.superclasses(distance=1, with_self=False)
+                ]
+            )
+
+        positions = {term_id: pos for pos, term_id in enumerate(ids)}
+        parents = [
+            tuple(positions[p] for p in term_parents if p in positions)
+            for term_parents in parent_ids
+        ]
+        self.__index = TermIndex(ids=ids, positions=positions, parents=parents)
+        logger.debug(f'Indexed {len(ids)} terms')
+        return self.__index
 
     def get_term(self, term_id: str) -> object:
         """Retrieves the ontology term object for a given term ID.
@@ -198,6 +296,9 @@ class NavigatorPronto(NavigatorOntology):
     ) -> list[str]:
         """Retrieve all ancestor term IDs (superclasses) of a given term.
 
+        The most recent results are cached per navigator (see `clear_cache`);
+        each call returns a fresh list.
+
         Args:
             term_id (str): The identifier of the term whose ancestors are to be retrieved.
             distance (int | None, optional): The maximum distance to traverse up the hierarchy. If None, retrieves all ancestors. Defaults to None.
@@ -216,12 +317,18 @@ class NavigatorPronto(NavigatorOntology):
             logger.exception(f"Term ID '{term_id}' not found in ontology.")
             return []
 
+        key = (term_id, distance, include_self)
+        cached = self._cache_get(self.__ancestors_cache, key)
+        if cached is not None:
+            return list(cached)
+
         try:
             ancestor_terms = term.superclasses(
                 distance=distance, with_self=include_self
             )
             ancestor_ids = [ancestor.id for ancestor in ancestor_terms]
             logger.debug(f"Ancestors of term '{term_id}': {ancestor_ids}")
+            self._cache_put(self.__ancestors_cache, key, tuple(ancestor_ids))
             return ancestor_ids
         except Exception as e:
             logger.exception(
@@ -281,6 +388,9 @@ class NavigatorPronto(NavigatorOntology):
     ) -> set[str]:
         """Retrieve all descendant term IDs (subclasses) of a given term.
 
+        The most recent results are cached per navigator (see `clear_cache`);
+        each call returns a fresh set.
+
         Args:
             term_id (str): The identifier of the term whose descendants are to be retrieved.
             distance (int | None, optional): The maximum distance to traverse down the hierarchy. If None, retrieves all descendants. Defaults to None.
@@ -299,6 +409,11 @@ class NavigatorPronto(NavigatorOntology):
             logger.exception(f"Term ID '{term_id}' not found in ontology.")
             return set()
 
+        key = (term_id, distance, include_self)
+        cached = self._cache_get(self.__descendants_cache, key)
+        if cached is not None:
+            return set(cached)
+
         try:
             descendant_ids = {
                 descendant.id
@@ -307,6 +422,9 @@ class NavigatorPronto(NavigatorOntology):
             if not include_self and term.id in descendant_ids:
                 descendant_ids.remove(term.id)
             logger.debug(f"Descendants of term '{term_id}': {descendant_ids}")
+            self._cache_put(
+                self.__descendants_cache, key, frozenset(descendant_ids)
+            )
             return descendant_ids
         except Exception as e:
             logger.exception(
@@ -2,7 +2,12 @@ from abc import ABC, abstractmethod
 import logging
 from collections import deque
 
-from ontograph.queries.navigator import NavigatorOntology as _OntologyNavigator
+import numpy as np
+
+from ontograph.queries.navigator import (
+    TermIndex,
+    NavigatorOntology as _OntologyNavigator,
+)
 
 __all__ = [
     'RelationsOntology',
@@ -11,6 +16,39 @@ __all__ = [
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Single-bit masks for bit positions 0..63 of a packed uint64 word
+_BIT = np.left_shift(np.uint64(1), np.arange(64, dtype=np.uint64))
+
+
+def _topological_order(index: TermIndex) -> list[int]:
+    """Order term positions so that every parent precedes its children.
+
+    Args:
+        index (TermIndex): The navigator's term index.
+
+    Returns:
+        list[int]: Term positions in topological order (Kahn's algorithm).
+
+    Raises:
+        ValueError: If the ``is_a`` hierarchy contains a cycle.
+    """
+    children = [[] for _ in range(len(index))]
+    pending = [len(parents) for parents in index.parents]
+    for child, parents in enumerate(index.parents):
+        for parent in parents:
+            children[parent].append(child)
+
+    order = [pos for pos, count in enumerate(pending) if count == 0]
+    for pos in order:
+        for child in children[pos]:
+            pending[child] -= 1
+            if pending[child] == 0:
+                order.append(child)
+
+    if len(order) != len(index):
+        raise ValueError('The is_a hierarchy contains a cycle')
+    return order
+
 
 # --------------------------------------------------------
 # ----     OntologyRelations Port (abstract class)    ----
@@ -63,10 +101,119 @@ class RelationsPronto(RelationsOntology):
             navigator (_OntologyNavigator): The ontology navigator instance.
         """
         self.__navigator = navigator
+        self.__index = None
+        self.__ancestor_bits = None
+        self.__descendant_bits = None
+        self.__distances = None
+
+    def build_ancestry_index(self) -> None:
+        """Precompute packed ancestor and descendant bitsets for every term.
+
+        Once built, `is_ancestor` and `is_descendant` answer with a single
+        bit test instead of a traversal. Each bitset table takes
+        ``N * ceil(N / 64) * 8`` bytes for N terms, so the index is opt-in;
+        build it once after loading when many relationship checks follow.
+
+        Raises:
+            ValueError: If the ``is_a`` hierarchy contains a cycle.
+        """
+        index = self.__navigator.build_index()
+        order = _topological_order(index)
+        words = (len(index) + 63) >> 6
+        ancestors = np.zeros((len(index), words), dtype=np.uint64)
+        descendants = np.zeros_like(ancestors)
+
+        # Parents come first in `order`, so their rows are already complete
+        for pos in order:
+            row = ancestors[pos]
+            for parent in index.parents[pos]:
+                row |= ancestors[parent]
+                row[parent >> 6] |= _BIT[parent & 63]
+        for pos in reversed(order):
+            for parent in index.parents[pos]:
+                row = descendants[parent]
+                row |= descendants[pos]
+                row[pos >> 6] |= _BIT[pos & 63]
+
+        self.__index = index
+        self.__ancestor_bits = ancestors
+        self.__descendant_bits = descendants
+        logger.debug(f'Built ancestry bitsets for {len(index)} terms')
+
+    def build_distance_table(self, max_terms: int = 50_000) -> None:
+        """Precompute the shortest distance from every term to each ancestor.
+
+        Once built, `_get_distance_to_ancestor` and
+        `get_lowest_common_ancestors` read distances from the table instead
+        of searching the hierarchy. The table holds one entry per
+        (term, ancestor) pair, so it is opt-in and refused for ontologies
+        larger than `max_terms`.
+
+        Args:
+            max_terms (int, optional): Largest number of terms to build the
+                table for. Defaults to 50_000.
+
+        Raises:
+            ValueError: If the ontology has more than `max_terms` terms or
+                the ``is_a`` hierarchy contains a cycle.
+        """
+        index = self.__navigator.build_index()
+        if len(index) > max_terms:
+            raise ValueError(
+                f'Distance table limited to {max_terms} terms, '
+                f'ontology has {len(index)}'
+            )
+
+        # Parents come first in `order`, so their distances are final when
+        # a child merges them in
+        distances: list[dict[int, int]] = [{} for _ in range(len(index))]
+        for pos in _topological_order(index):
+            row = distances[pos]
+            for parent in index.parents[pos]:
+                row[parent] = 1
+                for ancestor, dist in distances[parent].items():
+                    known = row.get(ancestor)
+                    if known is None or dist + 1 < known:
+                        row[ancestor] = dist + 1
+
+        self.__index = index
+        self.__distances = distances
+        logger.debug(f'Built ancestor distance table for {len(index)} terms')
+
+    def _test_bit(self, bits: np.ndarray, row: str, column: str) -> bool:
+        """Return whether `column`'s bit is set in `row`'s packed bitset."""
+        positions = self.__index.positions
+        row_pos = positions.get(row)
+        column_pos = positions.get(column)
+        if row_pos is None or column_pos is None:
+            return False
+        return bool(bits[row_pos, column_pos >> 6] & _BIT[column_pos & 63])
+
+    def _get_common_ancestors_from_bits(self, node_ids: list[str]) -> set:
+        """Intersect the nodes' ancestor bitsets, each node included."""
+        rows = []
+        for node_id in node_ids:
+            pos = self.__index.positions.get(node_id)
+            if pos is None:
+                return set()
+            rows.append(pos)
+
+        selected = self.__ancestor_bits[rows]  # Fancy indexing copies
+        for row, pos in enumerate(rows):
+            selected[row, pos >> 6] |= _BIT[pos & 63]
+        common = np.bitwise_and.reduce(selected, axis=0)
+
+        bits = np.unpackbits(
+            common.astype('<u8').view(np.uint8), bitorder='little'
+        )
+        ids = self.__index.ids
+        return {ids[pos] for pos in np.flatnonzero(bits).tolist()}
 
     def is_ancestor(self, ancestor_node: str, descendant_node: str) -> bool:
         """Determines if `ancestor_node` is an ancestor of `descendant_node`.
 
+        Uses the bitsets from `build_ancestry_index` when they are built.
+
         Args:
             ancestor_node (str): The ID of the potential ancestor term.
             descendant_node (str): The ID of the potential descendant term.
@@ -77,6 +224,10 @@ class RelationsPronto(RelationsOntology):
         Raises:
             Exception: If an unexpected error occurs during ancestor lookup.
         """
+        if self.__ancestor_bits is not None:
+            return self._test_bit(
+                self.__ancestor_bits, descendant_node, ancestor_node
+            )
         try:
             ancestors = self.__navigator.get_ancestors(
                 descendant_node, include_self=False
@@ -89,6 +240,8 @@ class RelationsPronto(RelationsOntology):
     def is_descendant(self, descendant_node: str, ancestor_node: str) -> bool:
         """Determines if `descendant_node` is a descendant of `ancestor_node`.
 
+        Uses the bitsets from `build_ancestry_index` when they are built.
+
         Args:
             descendant_node (str): The ID of the potential descendant term.
             ancestor_node (str): The ID of the potential ancestor term.
@@ -99,6 +252,10 @@ class RelationsPronto(RelationsOntology):
         Raises:
             Exception: If an unexpected error occurs during descendant lookup.
         """
+        if self.__descendant_bits is not None:
+            return self._test_bit(
+                self.__descendant_bits, ancestor_node, descendant_node
+            )
         try:
             descendants = self.__navigator.get_descendants(
                 ancestor_node, include_self=False
@@ -112,6 +269,7 @@ class RelationsPronto(RelationsOntology):
         """Determine if two nodes are siblings (share at least one parent).
 
         Siblings are defined as nodes that are not the same and share at least one parent (i.e., their sets of parents intersect).
+        Uses the parent index from `build_ancestry_index` when it is built.
 
         Args:
             node_a (str): The ID of the first node.
@@ -124,6 +282,14 @@ class RelationsPronto(RelationsOntology):
             KeyError: If either node_a or node_b is not found in the ontology.
             Exception: If an error occurs during parent lookup.
         """
+        if self.__index is not None:
+            positions = self.__index.positions
+            pos_a = positions.get(node_a)
+            pos_b = positions.get(node_b)
+            if pos_a is None or pos_b is None or pos_a == pos_b:
+                return False
+            parents = self.__index.parents
+            return not frozenset(parents[pos_a]).isdisjoint(parents[pos_b])
         try:
             parentsA = set(self.__navigator.get_parents(term_id=node_a))
             parentsB = set(self.__navigator.get_parents(term_id=node_b))
@@ -134,11 +300,40 @@ class RelationsPronto(RelationsOntology):
             logger.error(f'Error checking sibling relationship: {e}')
             raise
 
+    def _get_distance_from_index(self, start: int, target: int) -> int | float:
+        """Shortest upward distance between two term positions in the index."""
+        if start == target:
+            return 0
+        if not self.__ancestor_bits[start, target >> 6] & _BIT[target & 63]:
+            return float('inf')
+
+        # Level-synchronous BFS over integer parent positions
+        parents = self.__index.parents
+        visited = bytearray(len(self.__index))
+        visited[start] = 1
+        frontier = [start]
+        dist = 0
+        while frontier:
+            dist += 1
+            next_frontier = []
+            for pos in frontier:
+                for parent in parents[pos]:
+                    if parent == target:
+                        return dist
+                    if not visited[parent]:
+                        visited[parent] = 1
+                        next_frontier.append(parent)
+            frontier = next_frontier
+        return float('inf')
+
     def _get_distance_to_ancestor(
         self, node: str, ancestor: str
     ) -> int | float:
         """Calculate the shortest distance from a node to a specified ancestor.
 
+        Reads the table from `build_distance_table`, or searches the integer
+        parent index from `build_ancestry_index`, when either is built.
+
         Args:
             node (str): The ID of the starting node.
             ancestor (str): The ID of the ancestor node to find.
@@ -150,33 +345,93 @@ class RelationsPronto(RelationsOntology):
         Raises:
             Exception: If an error occurs during term lookup or traversal.
         """
+        if self.__index is not None and node in self.__index.positions:
+            start = self.__index.positions[node]
+            target = self.__index.positions.get(ancestor)
+            if target is None:
+                return float('inf')
+            if self.__distances is not None:
+                if start == target:
+                    return 0
+                return self.__distances[start].get(target, float('inf'))
+            if self.__ancestor_bits is not None:
+                return self._get_distance_from_index(start, target)
+
         try:
             term = self.__navigator.get_term(node)
         except Exception as e:
             logger.error(f"Error retrieving term for node '{node}': {e}")
             raise
 
-        visited = set()
+        if term.id == ancestor:
+            return 0
+
+        # Terms are marked when queued, so each one is expanded at most once
+        # and the search stops as soon as the ancestor is reached
+        visited = {term.id}
         queue = deque([(term, 0)])
         while queue:
             try:
                 current, dist = queue.popleft()
-                if current.id == ancestor:
-                    return dist
-                if current.id in visited:
-                    continue
-                visited.add(current.id)
                 for parent in current.superclasses(distance=1, with_self=False):
+                    if parent.id == ancestor:
+                        return dist + 1
                     if parent.id not in visited:
+                        visited.add(parent.id)
                         queue.append((parent, dist + 1))
             except Exception as e:
                 logger.error(f'Error during ancestor traversal: {e}')
                 raise
         return float('inf')
 
+    def _get_ancestor_distances(self, node: str) -> dict[str, int]:
+        """Calculate the shortest distance from a node to each of its ancestors.
+
+        Reads the table from `build_distance_table` when it is built.
+
+        Args:
+            node (str): The ID of the starting node.
+
+        Returns:
+            dict[str, int]: Distance to every ancestor, with `node` itself at 0.
+
+        Raises:
+            Exception: If an error occurs during term lookup or traversal.
+        """
+        if self.__distances is not None and node in self.__index.positions:
+            pos = self.__index.positions[node]
+            ids = self.__index.ids
+            distances = {ids[a]: d for a, d in self.__distances[pos].items()}
+            distances[node] = 0
+            return distances
+
+        try:
+            term = self.__navigator.get_term(node)
+        except Exception as e:
+            logger.error(f"Error retrieving term for node '{node}': {e}")
+            raise
+
+        # Unweighted BFS: the first visit to a term is along a shortest path
+        distances = {term.id: 0}
+        queue = deque([term])
+        while queue:
+            try:
+                current = queue.popleft()
+                dist = distances[current.id] + 1
+                for parent in current.superclasses(distance=1, with_self=False):
+                    if parent.id not in distances:
+                        distances[parent.id] = dist
+                        queue.append(parent)
+            except Exception as e:
+                logger.error(f'Error during ancestor traversal: {e}')
+                raise
+        return distances
+
     def get_common_ancestors(self, node_ids: list[str]) -> set:
         """Finds the common ancestors of a list of nodes.
 
+        Uses the bitsets from `build_ancestry_index` when they are built.
+
         Args:
             node_ids (list[str]): List of node IDs to find common ancestors for.
 
@@ -188,12 +443,14 @@ class RelationsPronto(RelationsOntology):
         """
         if not node_ids:
             return set()
+        if self.__ancestor_bits is not None:
+            return self._get_common_ancestors_from_bits(node_ids)
 
         ancestor_sets = []
         try:
             for node_id in node_ids:
                 try:
-                    ancestors = set(
+                    ancestors = frozenset(
                         self.__navigator.get_ancestors(
                             node_id, include_self=True
                         )
@@ -204,7 +461,11 @@ class RelationsPronto(RelationsOntology):
                         f"Error retrieving ancestors for node '{node_id}': {e}"
                     )
                     raise
-            common_ancestors = set.intersection(*ancestor_sets)
+            # Smallest first: each step only scans the shrinking result
+            ancestor_sets.sort(key=len)
+            common_ancestors = set(
+                ancestor_sets[0].intersection(*ancestor_sets[1:])
+            )
             logger.debug(f'Common ancestors: {common_ancestors}')
         except Exception as e:
             logger.error(f'Error during common ancestor computation: {e}')
@@ -231,14 +492,22 @@ class RelationsPronto(RelationsOntology):
 
         common_ancestors = self.get_common_ancestors(node_ids)
 
+        # One upward BFS per node, not one per (node, ancestor) pair
+        distance_maps = (
+            [self._get_ancestor_distances(node_id) for node_id in node_ids]
+            if common_ancestors
+            else []
+        )
+        unreachable = float('inf')
+
         # For each common ancestor, calculate its max distance from all nodes
-        distances = {}
-        for ancestor in common_ancestors:
-            max_dist = max(
-                self._get_distance_to_ancestor(node_id, ancestor)
-                for node_id in node_ids
+        distances = {
+            ancestor: max(
+                distance_map.get(ancestor, unreachable)
+                for distance_map in distance_maps
             )
-            distances[ancestor] = max_dist
+            for ancestor in common_ancestors
+        }
         logger.debug(f'Distances: {distances}')
 
         try:
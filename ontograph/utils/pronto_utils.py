@@ -1,12 +1,14 @@
+from typing import TYPE_CHECKING
 import logging
 
-from pronto import Ontology
+if TYPE_CHECKING:
+    from pronto import Ontology
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
-def extract_terms(ontology: Ontology, include_obsolete: bool = False) -> list:
+def extract_terms(ontology: 'Ontology', include_obsolete: bool = False) -> list:
     """Single-pass extraction of pronto.Term objects, sorted by term.id."""
     terms = [t for t in ontology.terms() if include_obsolete or not t.obsolete]
     terms.sort(key=lambda t: t.id)
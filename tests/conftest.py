@@ -0,0 +1,223 @@
+from dataclasses import field, dataclass
+import io
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+# Resolved once at import; a missing resource fails collection, not each test
+_DUMMY_ONTOLOGY = (
+    Path(__file__).parent / 'resources' / 'dummy_ontology.obo'
+).resolve(strict=True)
+# Set to '0' to always parse the dummy ontology instead of unpickling it
+_PICKLE_CACHE_ENV = 'ONTOGRAPH_TEST_PICKLE_CACHE'
+
+
+@dataclass
+class MockCatalog:
+    """Lightweight stand-in for CatalogOntologies in downloader tests.
+
+    URLs default to ``http://example.com/{name_id}.{format_type}``; entries
+    in ``urls`` override the default per ``name_id`` and ``missing`` always
+    resolves to ``None``.
+    """
+
+    urls: dict[str, str] = field(default_factory=dict)
+
+    def get_download_url(self, name_id: str, format_type: str) -> str | None:
+        if name_id == 'missing':
+            return None
+        return self.urls.get(
+            name_id, f'http://example.com/{name_id}.{format_type}'
+        )
+
+
+@pytest.fixture
+def mock_catalog():
+    """Create a mock catalog for testing."""
+    return MockCatalog()
+
+
+def _raiser(exc):
+    def _raise(*args, **kwargs):
+        raise exc
+
+    return _raise
+
+
+@pytest.fixture
+def raiser():
+    """Return a factory for callables that raise ``exc`` when called."""
+    return _raiser
+
+
+class StubDownloader:
+    """Downloader whose methods delegate to the callables it was given."""
+
+    def __init__(self, fetch_from_url=None, fetch_from_catalog=None) -> None:
+        self._fetch_from_url = fetch_from_url
+        self._fetch_from_catalog = fetch_from_catalog
+
+    def fetch_from_url(self, url_ontology, filename):
+        return self._fetch_from_url(url_ontology, filename)
+
+    def fetch_from_catalog(self, resources, catalog):
+        return self._fetch_from_catalog(resources, catalog)
+
+
+@pytest.fixture
+def make_downloader():
+    """Build a downloader from ``fetch_from_url``/``fetch_from_catalog``."""
+    return StubDownloader
+
+
+class FakeHttp(dict):
+    """URL to body mapping served in place of real HTTP requests.
+
+    Registered URLs answer ``200`` with their body, anything else ``404``.
+    Requested URLs are recorded in ``calls``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+
+    def send(self, request):
+        import requests
+
+        self.calls.append(request.url)
+        body = self.get(request.url)
+
+        response = requests.Response()
+        response.status_code = 404 if body is None else 200
+        response.reason = 'Not Found' if body is None else 'OK'
+        response._content = body or b''
+        response._content_consumed = True
+        response.raw = io.BytesIO(response._content)
+        response.headers['Content-Length'] = str(len(response._content))
+        response.url = request.url
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def fast_http(monkeypatch):
+    """Answer requests from an in-memory URL registry instead of the network."""
+    from requests.adapters import HTTPAdapter
+
+    stub = FakeHttp()
+    monkeypatch.setattr(
+        HTTPAdapter,
+        'send',
+        lambda adapter, request, **kwargs: stub.send(request),
+    )
+    return stub
+
+
+# Dummy OBO Foundry registry, pre-serialized so fixtures skip the YAML emitter
+_CATALOG_DATA = {
+    'ontologies': [
+        {
+            'id': 'chebi',
+            'title': 'ChEBI',
+            'products': [
+                {
+                    'id': 'chebi.obo',
+                    'ontology_purl': 'http://example.com/chebi.obo',
+                },
+                {
+                    'id': 'chebi.owl',
+                    'ontology_purl': 'http://example.com/chebi.owl',
+                },
+            ],
+        },
+        {
+            'id': 'ado',
+            'title': 'ADO',
+            'products': [
+                {
+                    'id': 'ado.owl',
+                    'ontology_purl': 'http://example.com/ado.owl',
+                },
+            ],
+        },
+    ]
+}
+
+_CATALOG_YAML = (
+    b'ontologies:\n'
+    b'- id: chebi\n'
+    b'  products:\n'
+    b'  - id: chebi.obo\n'
+    b'    ontology_purl: http://example.com/chebi.obo\n'
+    b'  - id: chebi.owl\n'
+    b'    ontology_purl: http://example.com/chebi.owl\n'
+    b'  title: ChEBI\n'
+    b'- id: ado\n'
+    b'  products:\n'
+    b'  - id: ado.owl\n'
+    b'    ontology_purl: http://example.com/ado.owl\n'
+    b'  title: ADO\n'
+)
+
+
+@pytest.fixture(scope='session')
+def dummy_catalog(tmp_path_factory):
+    # Create a dummy OBO Foundry registry YAML file
+    catalog_file = tmp_path_factory.mktemp('cat') / 'obofoundry_registry.yml'
+    catalog_file.write_bytes(_CATALOG_YAML)
+    return catalog_file, _CATALOG_DATA
+
+
+@pytest.fixture(scope='session')
+def catalogontologies(dummy_catalog):
+    """Catalog loaded once from ``dummy_catalog``; tests must not mutate it."""
+    from ontograph.config import settings
+    from ontograph.models import CatalogOntologies
+
+    catalog_file, _ = dummy_catalog
+    # Monkeypatch config to use our dummy file while the catalog loads
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, 'NAME_OBO_FOUNDRY_CATALOG', catalog_file.name)
+        obo_reg = CatalogOntologies(cache_dir=catalog_file.parent)
+        obo_reg.load_catalog()
+    return obo_reg
+
+
+@pytest.fixture(scope='session')
+def cached_dummy_ontology(request):
+    """Dummy ontology, pickled in the pytest cache to skip re-parsing."""
+    from ontograph.loader import ProntoLoaderAdapter
+
+    use_cache = os.environ.get(_PICKLE_CACHE_ENV, '1') != '0'
+    # config.cache is absent when run with -p no:cacheprovider
+    cache = getattr(request.config, 'cache', None)
+    if use_cache and cache is not None:
+        # The loader keys pickles on file content and pronto version, and
+        # renames them into place, so xdist workers can share the directory
+        loader = ProntoLoaderAdapter(
+            cache_dir=cache.mkdir('ontocache'), pickle_cache=True
+        )
+    else:
+        loader = ProntoLoaderAdapter(cache_dir=_DUMMY_ONTOLOGY.parent)
+    return loader.load_from_file(file_path_ontology=_DUMMY_ONTOLOGY)
+
+
+@pytest.fixture(scope='session')
+def dummy_ontology(cached_dummy_ontology):
+    """Dummy ontology shared by the whole session; tests must not mutate it."""
+    return cached_dummy_ontology
+
+
+@pytest.fixture(scope='session')
+def resources_dir(tmp_path_factory):
+    """Session copy of tests/resources, safe to write to under xdist."""
+    copy_dir = tmp_path_factory.mktemp('res')
+    shutil.copytree(_DUMMY_ONTOLOGY.parent, copy_dir, dirs_exist_ok=True)
+    return copy_dir
+
+
+@pytest.fixture(scope='session')
+def dummy_ontology_path(resources_dir):
+    return resources_dir / 'dummy_ontology.obo'
@@ -1,5 +1,3 @@
-from pathlib import Path
-
 import pytest
 import ontograph.client as client_module
 
@@ -9,9 +7,10 @@ from ontograph.models import Ontology, TermList
 __all__ = [
     'client_catalog',
     'client_ontology',
-    'dummy_ontology_path',
-    'resources_dir',
+    'loaded_client_ontology',
     'test_catalog_as_dict_type',
+    'test_client_ontology_build_indexes',
+    'test_client_ontology_build_indexes_graphblas',
     'test_client_ontology_introspection_methods',
     'test_client_ontology_load_from_file',
     'test_client_ontology_load_invalid_strategy',
@@ -28,16 +27,6 @@ __all__ = [
 # -----------------------------------
 
 
-@pytest.fixture
-def resources_dir():
-    return Path(__file__).parent / 'resources'
-
-
-@pytest.fixture
-def dummy_ontology_path(resources_dir):
-    return resources_dir / 'dummy_ontology.obo'
-
-
 @pytest.fixture
 def client_catalog(resources_dir):
     # Use a test cache directory
@@ -49,6 +38,14 @@ def client_ontology(resources_dir):
     return ClientOntology(cache_dir=resources_dir)
 
 
+@pytest.fixture(scope='session')
+def loaded_client_ontology(resources_dir, dummy_ontology_path):
+    # Parsed once and shared by the read-only query tests
+    client = ClientOntology(cache_dir=resources_dir)
+    client.load(source=str(dummy_ontology_path))
+    return client
+
+
 # -----------------------------------
 # ----         Unit Tests        ----
 # -----------------------------------
@@ -146,50 +143,71 @@ def test_client_ontology_load_multiple_strategies(
         )
 
 
-def test_client_ontology_navigation_methods(
-    client_ontology, dummy_ontology_path
-):
-    client_ontology.load(source=str(dummy_ontology_path))
+def test_client_ontology_navigation_methods(loaded_client_ontology):
     # Test navigation methods
-    # term = client_ontology.get_term('A')
+    # term = loaded_client_ontology.get_term('A')
     # assert term.id == 'A'
-    parents = client_ontology.get_parents('D')
+    parents = loaded_client_ontology.get_parents('D')
     assert 'A' in parents
-    children = client_ontology.get_children('A')
+    children = loaded_client_ontology.get_children('A')
     assert 'D' in children
-    ancestors = client_ontology.get_ancestors('D')
+    ancestors = loaded_client_ontology.get_ancestors('D')
     assert 'A' in ancestors
-    descendants = client_ontology.get_descendants('A')
+    descendants = loaded_client_ontology.get_descendants('A')
     assert 'D' in descendants
-    siblings = client_ontology.get_siblings('D')
+    siblings = loaded_client_ontology.get_siblings('D')
     assert isinstance(siblings, TermList)
 
 
-def test_client_ontology_relations_methods(
-    client_ontology, dummy_ontology_path
-):
-    client_ontology.load(source=str(dummy_ontology_path))
+def test_client_ontology_relations_methods(loaded_client_ontology):
     # Test relation methods
-    assert client_ontology.is_ancestor('A', 'D') is True
-    assert client_ontology.is_descendant('D', 'A') is True
-    assert client_ontology.is_sibling('K1', 'K2') is True
-    common_ancestors = client_ontology.get_common_ancestors(['K1', 'K2'])
+    assert loaded_client_ontology.is_ancestor('A', 'D') is True
+    assert loaded_client_ontology.is_descendant('D', 'A') is True
+    assert loaded_client_ontology.is_sibling('K1', 'K2') is True
+    common_ancestors = loaded_client_ontology.get_common_ancestors(['K1', 'K2'])
     assert 'G' in common_ancestors
 
 
-def test_client_ontology_introspection_methods(
-    client_ontology, dummy_ontology_path
-):
-    client_ontology.load(source=str(dummy_ontology_path))
+def test_client_ontology_introspection_methods(loaded_client_ontology):
     # Test introspection methods
-    distance = client_ontology.get_distance_from_root('D')
+    distance = loaded_client_ontology.get_distance_from_root('D')
     assert isinstance(distance, int)
-    path = client_ontology.get_path_between('A', 'D')
+    path = loaded_client_ontology.get_path_between('A', 'D')
     assert isinstance(path, list)
-    trajectories = client_ontology.get_trajectories_from_root('D')
+    trajectories = loaded_client_ontology.get_trajectories_from_root('D')
     assert isinstance(trajectories, list)
 
 
+def test_client_ontology_build_indexes(resources_dir, dummy_ontology_path):
+    client = ClientOntology(cache_dir=resources_dir)
+    with pytest.raises(RuntimeError):
+        client.build_indexes()
+
+    client.load(source=str(dummy_ontology_path), build_indexes=True)
+    relations = client._relations
+    assert relations._RelationsPronto__ancestor_bits is not None
+    assert relations._RelationsPronto__distances is None
+    assert client.is_ancestor('A', 'D') is True
+    assert client.is_sibling('K1', 'K2') is True
+    assert 'G' in client.get_common_ancestors(['K1', 'K2'])
+
+    client.build_indexes(distance_table=True)
+    assert relations._RelationsPronto__distances is not None
+    assert 'G' in client.get_lowest_common_ancestors(['K1', 'K2'])
+    assert client.get_distance_from_root('D') == 2
+
+
+def test_client_ontology_build_indexes_graphblas(
+    resources_dir, dummy_ontology_path
+):
+    # The graphblas backend has no precomputed indexes; nothing to build
+    client = ClientOntology(cache_dir=resources_dir)
+    client.load(
+        source=str(dummy_ontology_path), backend='graphblas', build_indexes=True
+    )
+    assert client.is_ancestor('A', 'D') is True
+
+
 def test_client_catalog_downloader_string_uses_backend(tmp_path, monkeypatch):
     class DummyDownloader:
         pass
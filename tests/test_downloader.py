@@ -1,9 +1,8 @@
+import os
 from pathlib import Path
-import tempfile
+import threading
 
 import pytest
-import requests
-import responses
 
 from ontograph.downloader import (
     DownloaderPort,
@@ -12,12 +11,6 @@ from ontograph.downloader import (
 )
 from ontograph.config import settings
 
-__all__ = [
-    'MockCatalog',
-    'TestDownloaderPort',
-    'TestPoochDownloaderAdapter',
-]
-
 
 # Tests for DownloaderPort (Abstract Base Class)
 class TestDownloaderPort:
@@ -92,40 +85,26 @@ def test_get_default_downloader_invalid_backend(tmp_path, monkeypatch):
         get_default_downloader(cache_dir=tmp_path)
 
 
-class MockCatalog:
-    """Mock catalog class for testing."""
-
-    def get_download_url(self, name_id: str, format_type: str) -> str:
-        if name_id == 'missing':
-            return None
-        return f'http://example.com/{name_id}.{format_type}'
-
-
 class TestPoochDownloaderAdapter:
     """Test suite for the PoochDownloaderAdapter class."""
 
     @pytest.fixture
-    def temp_cache_dir(self):
-        """Create a temporary directory for test cache."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            yield Path(tmp_dir)
+    def temp_cache_dir(self, tmp_path):
+        """Use pytest's per-test directory as the download cache."""
+        return tmp_path
 
     @pytest.fixture
     def downloader(self, temp_cache_dir):
         """Create a PoochDownloaderAdapter instance for testing."""
         return PoochDownloaderAdapter(cache_dir=temp_cache_dir)
 
-    @pytest.fixture
-    def mock_catalog(self):
-        """Create a mock catalog for testing."""
-        return MockCatalog()
-
     def test_initialization(self, downloader, temp_cache_dir):
         """Test that PoochDownloaderAdapter initializes correctly."""
         assert downloader._cache_dir == temp_cache_dir
         assert isinstance(downloader._resources_paths, dict)
         assert len(downloader._resources_paths) == 0
         assert temp_cache_dir.exists()
+        assert not hasattr(downloader, '__dict__')
 
     def test_get_paths(self, downloader):
         """Test get_paths method returns resource paths dictionary."""
@@ -141,6 +120,10 @@ class TestPoochDownloaderAdapter:
         assert len(paths) == 1
         assert paths['test'] == test_path
 
+        # The returned dict is a snapshot, not a view on the adapter state
+        paths['other'] = Path('other/path')
+        assert 'other' not in downloader.get_paths()
+
     def test_validate_download_parameters(self, downloader):
         """Test parameter validation."""
         # Valid parameters
@@ -164,15 +147,14 @@ class TestPoochDownloaderAdapter:
         with pytest.raises(ValueError, match='Filename cannot be empty'):
             downloader._validate_download_parameters('http://example.com', '  ')
 
-    @responses.activate
-    def test_fetch_from_url(self, downloader, temp_cache_dir):
+    def test_fetch_from_url(self, downloader, temp_cache_dir, fast_http):
         """Test fetch_from_url method with mocked HTTP response."""
         test_url = 'http://example.com/test.owl'
         test_content = b'<owl>Test ontology content</owl>'
         test_filename = 'test.owl'
 
         # Mock HTTP response
-        responses.add(responses.GET, test_url, body=test_content, status=200)
+        fast_http[test_url] = test_content
 
         # Call method
         result_path = downloader.fetch_from_url(test_url, test_filename)
@@ -182,24 +164,106 @@ class TestPoochDownloaderAdapter:
         assert result_path.exists()
         assert result_path.parent == temp_cache_dir
         assert result_path.name == test_filename
+        assert result_path.read_bytes() == test_content
 
         # Check if added to resources paths
         assert 'test' in downloader._resources_paths
         assert downloader._resources_paths['test'] == result_path
 
-    @responses.activate
-    def test_fetch_from_url_request_exception(self, downloader):
+    def test_fetch_from_url_request_exception(self, downloader, fast_http):
         """Test fetch_from_url handles request exceptions correctly."""
+        from requests import RequestException
+
+        # Unregistered URLs answer 404
         test_url = 'http://example.com/error.owl'
-        test_filename = 'error.owl'
 
-        # Mock HTTP error
-        responses.add(responses.GET, test_url, status=404)
+        with pytest.raises(RequestException):
+            downloader.fetch_from_url(test_url, 'error.owl')
+        assert fast_http.calls == [test_url]
 
-        # Call method and expect exception
+    def test_fetch_from_url_content_addressed(
+        self, downloader, temp_cache_dir, fast_http
+    ):
+        """Test the same URL is downloaded once whatever the filename."""
+        url = 'http://example.com/go.obo'
+        fast_http[url] = b'GO ontology content'
 
-        with pytest.raises(requests.RequestException):
-            downloader.fetch_from_url(test_url, test_filename)
+        first = downloader.fetch_from_url(url, 'a.obo')
+        second = downloader.fetch_from_url(url, 'b.obo')
+
+        assert fast_http.calls == [url]
+        assert first.read_bytes() == second.read_bytes()
+        assert first.resolve() == second.resolve()
+        assert first.resolve().parent == (temp_cache_dir / 'objects').resolve()
+
+    def test_fetch_from_url_force_downloads_again(
+        self, downloader, temp_cache_dir, fast_http
+    ):
+        """Test force refreshes the cached object after the file is deleted."""
+        url = 'http://example.com/go.obo'
+        fast_http[url] = b'GO ontology content'
+        first = downloader.fetch_from_url(url, 'go.obo')
+
+        fast_http[url] = b'GO ontology content, new release'
+        first.unlink()
+        second = downloader.fetch_from_url(url, 'go.obo', force=True)
+
+        assert fast_http.calls == [url, url]
+        assert second.read_bytes() == b'GO ontology content, new release'
+
+    def test_fetch_from_url_replaces_stale_staging_link(
+        self, downloader, temp_cache_dir, fast_http
+    ):
+        """Test a staging link left by a crashed run does not break linking."""
+        url = 'http://example.com/go.obo'
+        fast_http[url] = b'GO ontology content'
+        first = downloader.fetch_from_url(url, 'a.obo')
+
+        staging = temp_cache_dir / (
+            f'.b.obo.{os.getpid()}.{threading.get_ident()}'
+        )
+        staging.symlink_to(first.resolve())
+
+        second = downloader.fetch_from_url(url, 'b.obo')
+        assert second.read_bytes() == b'GO ontology content'
+        assert not staging.exists()
+
+    def test_link_object_copies_without_symlink_support(
+        self, downloader, temp_cache_dir, fast_http, monkeypatch, raiser
+    ):
+        """Test objects are copied when symlinks are not permitted."""
+        url = 'http://example.com/go.obo'
+        fast_http[url] = b'GO ontology content'
+        monkeypatch.setattr(
+            Path, 'symlink_to', raiser(PermissionError('no symlinks'))
+        )
+
+        result = downloader.fetch_from_url(url, 'go.obo')
+        assert not result.is_symlink()
+        assert result.read_bytes() == b'GO ontology content'
+
+    def test_fetch_from_url_streams_in_large_chunks(
+        self, downloader, monkeypatch
+    ):
+        """Test HTTP downloads are streamed with the configured chunk size."""
+        import ontograph.downloader as downloader_module
+
+        calls = []
+
+        def fake_retrieve(**kwargs):
+            calls.append(kwargs)
+            target = Path(kwargs['path']) / kwargs['fname']
+            target.write_bytes(b'content')
+            return str(target)
+
+        monkeypatch.setattr(downloader_module, 'retrieve', fake_retrieve)
+
+        downloader.fetch_from_url('http://example.com/go.obo', 'go.obo')
+        http_downloader = calls[0]['downloader']
+        assert http_downloader.chunk_size == settings.DOWNLOAD_CHUNK_SIZE
+
+        downloader.fetch_from_url('ftp://example.com/go.obo', 'go.obo')
+        assert calls[1]['downloader'] is None
 
     def test_extract_resource_info(self, downloader):
         """Test _extract_resource_info extracts correct information."""
@@ -222,6 +286,18 @@ class TestPoochDownloaderAdapter:
         ):
             downloader._extract_resource_info(resource)
 
+    def test_extract_batch(self, downloader):
+        """Test _extract_batch validates the whole batch in one pass."""
+        resources = [{'name_id': 'go', 'format': 'owl'}, {'name_id': 'ado'}]
+        name_ids, format_types = downloader._extract_batch(resources)
+        assert name_ids == ['go', 'ado']
+        assert format_types == ['owl', 'obo']
+
+        with pytest.raises(
+            KeyError, match="Resource dictionary must contain 'name_id' key"
+        ):
+            downloader._extract_batch([{'name_id': 'go'}, {'name_id': ''}])
+
     def test_get_resource_url(self, downloader, mock_catalog):
         """Test _get_resource_url retrieves correct URL from catalog."""
         # Valid resource
@@ -234,6 +310,12 @@ class TestPoochDownloaderAdapter:
         ):
             downloader._get_resource_url('missing', 'owl', mock_catalog)
 
+    def test_get_resource_url_override(self, downloader, mock_catalog):
+        """Test _get_resource_url honours catalog URL overrides."""
+        mock_catalog.urls = {'go': 'http://mirror.example.com/go.obo'}
+        url = downloader._get_resource_url('go', 'obo', mock_catalog)
+        assert url == 'http://mirror.example.com/go.obo'
+
     @pytest.mark.parametrize(
         'resources',
         [
@@ -250,8 +332,7 @@ class TestPoochDownloaderAdapter:
         ):
             downloader.fetch_from_catalog(resources, mock_catalog)
 
-    @responses.activate
-    def test_fetch_from_catalog(self, downloader, mock_catalog):
+    def test_fetch_from_catalog(self, downloader, mock_catalog, fast_http):
         """Test fetch_from_catalog with multiple resources."""
         resources = [
             {'name_id': 'go', 'format': 'obo'},
@@ -259,18 +340,8 @@ class TestPoochDownloaderAdapter:
         ]
 
         # Mock HTTP responses
-        responses.add(
-            responses.GET,
-            'http://example.com/go.obo',
-            body=b'GO ontology content',
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            'http://example.com/ado.owl',
-            body=b'ADO ontology content',
-            status=200,
-        )
+        fast_http['http://example.com/go.obo'] = b'GO ontology content'
+        fast_http['http://example.com/ado.owl'] = b'ADO ontology content'
 
         # Call method
         results = downloader.fetch_from_catalog(resources, mock_catalog)
@@ -279,9 +350,196 @@ class TestPoochDownloaderAdapter:
         assert len(results) == 2
         assert 'go' in results
         assert 'ado' in results
-        assert results['go'].exists()
-        assert results['ado'].exists()
+        assert downloader._verify_batch(results) == results
 
         # Verify resources_paths is updated
         assert 'go' in downloader._resources_paths
         assert 'ado' in downloader._resources_paths
+
+    def test_fetch_from_catalog_disables_progress_bars(
+        self, downloader, mock_catalog, monkeypatch
+    ):
+        """Test batch downloads run without per-file progress bars."""
+        import ontograph.downloader as downloader_module
+
+        calls = []
+
+        def fake_retrieve(**kwargs):
+            calls.append(kwargs)
+            target = Path(kwargs['path']) / kwargs['fname']
+            target.write_bytes(b'content')
+            return str(target)
+
+        monkeypatch.setattr(downloader_module, 'retrieve', fake_retrieve)
+
+        downloader.fetch_from_catalog(
+            [{'name_id': 'go'}, {'name_id': 'ado'}], mock_catalog
+        )
+        list(downloader.iter_fetched([{'name_id': 'chebi'}], mock_catalog))
+        assert len(calls) == 3
+        for kwargs in calls:
+            assert kwargs['progressbar'] is False
+            assert kwargs['downloader'].progressbar is False
+
+        # A single download still shows its progress bar
+        downloader.fetch_from_url('http://example.com/go.obo', 'go.obo')
+        assert calls[-1]['downloader'].progressbar is True
+
+    def test_fetch_from_catalog_mixed_success(
+        self, downloader, mock_catalog, fast_http
+    ):
+        """Test fetch_from_catalog keeps completed downloads on failure."""
+        resources = [
+            {'name_id': 'go', 'format': 'obo'},
+            {'name_id': 'missing', 'format': 'obo'},
+        ]
+
+        fast_http['http://example.com/go.obo'] = b'GO ontology content'
+
+        with pytest.raises(
+            ValueError, match='Cannot find download URL for ontology missing'
+        ):
+            downloader.fetch_from_catalog(resources, mock_catalog)
+
+        assert 'go' in downloader.get_paths()
+        assert 'missing' not in downloader.get_paths()
+
+    def test_fetch_from_catalog_invalid_ontology(
+        self, downloader, mock_catalog
+    ):
+        """Test fetch_from_catalog rejects resources without a name_id."""
+        resources = [{'format': 'obo'}]
+
+        with pytest.raises(
+            KeyError, match="Resource dictionary must contain 'name_id' key"
+        ):
+            downloader.fetch_from_catalog(resources, mock_catalog)
+
+        assert downloader.get_paths() == {}
+
+    def test_fetch_from_catalog_downloads_concurrently(
+        self, downloader, mock_catalog, monkeypatch
+    ):
+        """Test fetch_from_catalog runs batch downloads in parallel."""
+        import ontograph.downloader as downloader_module
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_retrieve(**kwargs):
+            # Both downloads must be in flight at once to pass the barrier
+            barrier.wait()
+            target = Path(kwargs['path']) / kwargs['fname']
+            target.write_bytes(b'content')
+            return str(target)
+
+        monkeypatch.setattr(downloader_module, 'retrieve', fake_retrieve)
+
+        resources = [{'name_id': 'go'}, {'name_id': 'ado', 'format': 'owl'}]
+        results = downloader.fetch_from_catalog(resources, mock_catalog)
+
+        assert list(results) == ['go', 'ado']
+        assert results['ado'].name == 'ado.owl'
+        assert downloader._verify_batch(results) == results
+
+    def test_verify_batch_missing_file(self, downloader, temp_cache_dir):
+        """Test _verify_batch reports resources whose file is absent."""
+        (temp_cache_dir / 'go.obo').write_bytes(b'content')
+        results = {
+            'go': temp_cache_dir / 'go.obo',
+            'ado': temp_cache_dir / 'ado.owl',
+        }
+
+        with pytest.raises(FileNotFoundError, match='ado'):
+            downloader._verify_batch(results)
+
+    def test_prefetch(self, downloader, mock_catalog, fast_http):
+        """Test prefetch downloads a batch in the background."""
+        fast_http['http://example.com/go.obo'] = b'GO ontology content'
+
+        future = downloader.prefetch([{'name_id': 'go'}], mock_catalog)
+
+        assert future.result(timeout=5)['go'].read_bytes() == (
+            b'GO ontology content'
+        )
+        assert 'go' in downloader.get_paths()
+        downloader.close()
+
+    def test_prefetch_pool_uses_max_workers(self, temp_cache_dir):
+        """Test the prefetch pool honours max_workers and is shut by close."""
+        with PoochDownloaderAdapter(
+            cache_dir=temp_cache_dir, max_workers=1
+        ) as downloader:
+            future = downloader.prefetch([], None)
+            with pytest.raises(ValueError, match='empty'):
+                future.result(timeout=5)
+            executor = downloader._bg
+            assert executor._max_workers == 1
+        assert downloader._bg is None
+        assert executor._shutdown
+
+    def test_iter_fetched_yields_before_slowest_download(
+        self, downloader, mock_catalog, monkeypatch
+    ):
+        """Test iter_fetched yields finished files while others download."""
+        import ontograph.downloader as downloader_module
+
+        release = threading.Event()
+
+        def fake_retrieve(**kwargs):
+            if kwargs['url'].endswith('slow.obo'):
+                assert release.wait(timeout=5)
+            target = Path(kwargs['path']) / kwargs['fname']
+            target.write_bytes(b'content')
+            return str(target)
+
+        monkeypatch.setattr(downloader_module, 'retrieve', fake_retrieve)
+
+        resources = [{'name_id': 'slow'}, {'name_id': 'fast'}]
+        fetched = downloader.iter_fetched(resources, mock_catalog)
+
+        assert next(fetched)[0] == 'fast'
+        release.set()
+        assert [name_id for name_id, _ in fetched] == ['slow']
+
+    def test_iter_fetched_validates_on_call(self, downloader, mock_catalog):
+        """Test iter_fetched raises before iteration starts."""
+        with pytest.raises(ValueError, match='empty'):
+            downloader.iter_fetched([], mock_catalog)
+        with pytest.raises(ValueError, match='missing'):
+            downloader.iter_fetched([{'name_id': 'missing'}], mock_catalog)
+        with pytest.raises(KeyError):
+            downloader.iter_fetched([{'format': 'obo'}], mock_catalog)
+
+    def test_iter_fetched_close_cancels_pending(
+        self, temp_cache_dir, mock_catalog, monkeypatch
+    ):
+        """Test closing iter_fetched early drops the queued downloads."""
+        import ontograph.downloader as downloader_module
+
+        release = threading.Event()
+        started = []
+
+        def fake_retrieve(**kwargs):
+            started.append(kwargs['url'])
+            if not kwargs['url'].endswith('first.obo'):
+                assert release.wait(timeout=5)
+            target = Path(kwargs['path']) / kwargs['fname']
+            target.write_bytes(b'content')
+            return str(target)
+
+        monkeypatch.setattr(downloader_module, 'retrieve', fake_retrieve)
+        downloader = PoochDownloaderAdapter(
+            cache_dir=temp_cache_dir, max_workers=1
+        )
+
+        resources = [{'name_id': n} for n in ('first', 'second', 'third')]
+        fetched = downloader.iter_fetched(resources, mock_catalog)
+        assert next(fetched)[0] == 'first'
+        # Returns while 'second' is still blocked in its download
+        fetched.close()
+        release.set()
+
+        for thread in threading.enumerate():
+            if thread.name.startswith('ontograph-download'):
+                thread.join(timeout=5)
+        assert not any(url.endswith('third.obo') for url in started)
@@ -1,4 +1,5 @@
 from pathlib import Path
+import re
 
 import pytest
 
@@ -9,25 +10,30 @@ from ontograph.loader import (
 )
 from ontograph.models import Ontology
 
+_ERR_NOT_FOUND = re.compile(r'Ontology file not found')
+_ERR_PARSE = re.compile(r'Failed to load ontology from')
+_ERR_UNSUPPORTED = re.compile(r'Unsupported format: unsupported')
+_ERR_DOWNLOAD = re.compile(r'Failed to download ontology ado in format obo')
+_ERR_NO_CACHE_DIR = re.compile(r'Cache directory not set')
+_ERR_STUB = re.compile(r'^fail$')  # Raised verbatim by stubs and patches
+
 
 # -----------------------------------
 # ----      PyTest Fixtures      ----
 # -----------------------------------
-@pytest.fixture
-def resources_dir():
-    return Path(__file__).parent / 'resources'
-
-
-@pytest.fixture
-def dummy_ontology_path(resources_dir):
-    return resources_dir / 'dummy_ontology.obo'
-
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def pronto_loader(resources_dir):
+    # Shared by the module; tests patch it only through monkeypatch
     return ProntoLoaderAdapter(cache_dir=resources_dir)
 
 
+@pytest.fixture(scope='session')
+def loaded_dummy_ontology(resources_dir, dummy_ontology_path):
+    # Parse the dummy ontology once; error-path tests use their own loader
+    loader = ProntoLoaderAdapter(cache_dir=resources_dir)
+    return loader.load_from_file(dummy_ontology_path)
+
+
 # Tests for OntologyLoaderPort (ABC)
 def test_ontology_loader_port_is_abstract():
     with pytest.raises(TypeError):
@@ -40,17 +46,17 @@ def test_ontology_loader_port_is_abstract():
 
 
 # ---- Function: load_from_file()
-def test_load_from_file_success(pronto_loader, dummy_ontology_path):
-    ontology = pronto_loader.load_from_file(dummy_ontology_path)
+def test_load_from_file_success(loaded_dummy_ontology):
+    ontology = loaded_dummy_ontology
     assert isinstance(ontology, Ontology)
     assert hasattr(ontology, '_ontology')
     assert hasattr(ontology, '_ontology_id')
     assert ontology._ontology_id is not None
-    assert len(ontology._ontology.terms()) > 0
+    assert next(iter(ontology._ontology.terms()), None) is not None
 
 
 def test_load_from_file_not_found(pronto_loader):
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match=_ERR_NOT_FOUND):
         pronto_loader.load_from_file('nonexistent.obo')
 
 
@@ -64,43 +70,42 @@ def test_load_from_file_value_error(pronto_loader, tmp_path, monkeypatch):
         raise ValueError('fail')
 
     monkeypatch.setattr('pronto.Ontology', raise_value_error)
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match=_ERR_PARSE):
         pronto_loader.load_from_file(file_path)
 
 
 # ---- Function: load_from_catalog()
 def test_load_from_catalog_unsupported_format(pronto_loader):
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match=_ERR_UNSUPPORTED):
         pronto_loader.load_from_catalog('ado', format='unsupported')
 
 
-def test_load_from_catalog_file_not_found(pronto_loader, monkeypatch):
-    # Patch Path.exists to always return False
-    monkeypatch.setattr(Path, 'exists', lambda self: False)
+def test_load_from_catalog_file_not_found(tmp_path, monkeypatch, raiser):
+    # Empty cache dir, so the ontology file genuinely does not exist
+    loader = ProntoLoaderAdapter(cache_dir=tmp_path / 'empty')
     # Patch _download_ontology to raise FileNotFoundError
     monkeypatch.setattr(
-        pronto_loader,
+        loader,
         '_download_ontology',
-        lambda name_id, format: (_ for _ in ()).throw(
-            FileNotFoundError('fail')
-        ),
+        raiser(FileNotFoundError('fail')),
     )
-    with pytest.raises(FileNotFoundError):
-        pronto_loader.load_from_catalog('ado', format='obo')
+    with pytest.raises(FileNotFoundError, match=_ERR_STUB):
+        loader.load_from_catalog('ado', format='obo')
 
 
 def test_download_ontology_uses_default_downloader(
-    pronto_loader, tmp_path, monkeypatch
+    pronto_loader, tmp_path, monkeypatch, make_downloader
 ):
-    class DummyDownloader:
-        def fetch_from_catalog(self, resources, catalog):
-            return {'ado': tmp_path / 'ado.obo'}
-
+    downloader = make_downloader(
+        fetch_from_catalog=lambda resources, catalog: {
+            'ado': tmp_path / 'ado.obo'
+        }
+    )
     calls = {'count': 0}
 
     def fake_get_default(cache_dir):
         calls['count'] += 1
-        return DummyDownloader()
+        return downloader
 
     monkeypatch.setattr(
         loader_module, 'get_default_downloader', fake_get_default
@@ -141,69 +146,69 @@ def test_load_from_catalog_metadata_missing(
 
 
 # Function: load_from_url()
-def test_load_from_url_not_implemented(pronto_loader, monkeypatch):
-    class DummyDownloader:
-        def fetch_from_url(self, url_ontology, filename):
-            raise FileNotFoundError('fail')
-
-    with pytest.raises(FileNotFoundError):
-        pronto_loader.load_from_url(
-            'http://invalid-url', 'invalid.obo', downloader=DummyDownloader()
-        )
-
-
-def test_load_from_url_downloader_error(pronto_loader, monkeypatch):
-    class DummyDownloader:
-        def fetch_from_url(self, url_ontology, filename):
-            raise FileNotFoundError('fail')
-
-    with pytest.raises(FileNotFoundError):
-        pronto_loader.load_from_url(
-            'http://example.com/ado.obo',
-            'ado.obo',
-            downloader=DummyDownloader(),
-        )
+@pytest.mark.parametrize(
+    ('url', 'filename'),
+    [
+        ('http://invalid-url', 'invalid.obo'),
+        ('http://example.com/ado.obo', 'ado.obo'),
+    ],
+)
+def test_load_from_url_downloader_error(
+    pronto_loader, make_downloader, raiser, url, filename
+):
+    downloader = make_downloader(
+        fetch_from_url=raiser(FileNotFoundError('fail'))
+    )
+    with pytest.raises(FileNotFoundError, match=_ERR_STUB):
+        pronto_loader.load_from_url(url, filename, downloader=downloader)
 
 
 def test_load_from_url_load_ontology_error(
-    pronto_loader, monkeypatch, tmp_path
+    pronto_loader, monkeypatch, tmp_path, make_downloader, raiser
 ):
-    class DummyDownloader:
-        def fetch_from_url(self, url_ontology, filename):
-            # Use pytest's tmp_path fixture for a safe temp file
-            temp_file = tmp_path / 'ado.obo'
-            temp_file.write_text('dummy content')
-            return temp_file
+    def write_file(url_ontology, filename):
+        # Use pytest's tmp_path fixture for a safe temp file
+        temp_file = tmp_path / 'ado.obo'
+        temp_file.write_text('dummy content')
+        return temp_file
 
     monkeypatch.setattr(
         pronto_loader,
         '_load_ontology',
-        lambda fp: (_ for _ in ()).throw(ValueError('fail')),
+        raiser(ValueError('fail')),
     )
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match=_ERR_STUB):
         pronto_loader.load_from_url(
             'http://example.com/ado.obo',
             'ado.obo',
-            downloader=DummyDownloader(),
+            downloader=make_downloader(fetch_from_url=write_file),
         )
 
 
-def test_download_ontology_not_implemented(pronto_loader, monkeypatch):
-    # Patch downloader.fetch_from_catalog to raise Exception
-    class DummyDownloader:
-        def fetch_from_catalog(self, resources, catalog):
-            raise Exception('fail')
+def test_download_ontology_not_implemented(
+    pronto_loader, make_downloader, raiser
+):
+    # Downloader whose fetch_from_catalog raises Exception
+    downloader = make_downloader(fetch_from_catalog=raiser(Exception('fail')))
+    with pytest.raises(RuntimeError, match=_ERR_DOWNLOAD):
+        pronto_loader._download_ontology('ado', 'obo', downloader=downloader)
 
-    with pytest.raises(RuntimeError):
-        pronto_loader._download_ontology(
-            'ado', 'obo', downloader=DummyDownloader()
-        )
+
+def test_init_with_string_path(tmp_path, monkeypatch):
+    # Resolve the relative cache dir inside tmp_path, not the repository
+    monkeypatch.chdir(tmp_path)
+    loader = ProntoLoaderAdapter(cache_dir='./test_cache')
+    assert loader.cache_dir == Path('./test_cache')
+
+    # The directory is created once the catalog is first accessed
+    _ = loader.catalog
+    assert (tmp_path / 'test_cache').is_dir()
 
 
 def test_cache_dir_property_value_error():
     loader = ProntoLoaderAdapter(cache_dir=None)
     loader._cache_dir = None
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match=_ERR_NO_CACHE_DIR):
         _ = loader.cache_dir
 
 
@@ -231,14 +236,43 @@ def test_extract_ontology_id_type_error(pronto_loader):
     assert pronto_loader._extract_ontology_id(DummyOntology()) is None
 
 
-def test_load_ontology_type_error(pronto_loader, tmp_path, monkeypatch):
+def test_load_ontology_type_error(pronto_loader, tmp_path, monkeypatch, raiser):
     # Create a dummy file
     file_path = tmp_path / 'bad.obo'
     file_path.write_text('bad content')
 
     # Patch pronto.Ontology to raise TypeError
-    monkeypatch.setattr(
-        'pronto.Ontology', lambda fp: (_ for _ in ()).throw(TypeError('fail'))
-    )
-    with pytest.raises(ValueError):
+    monkeypatch.setattr('pronto.Ontology', raiser(TypeError('fail')))
+    with pytest.raises(ValueError, match=_ERR_PARSE):
         pronto_loader._load_ontology(file_path)
+
+
+# ---- Pickle cache
+def test_pickle_cache_disabled_by_default(pronto_loader):
+    assert not pronto_loader._pickle_cache
+
+
+def test_pickle_cache_skips_reparsing(
+    tmp_path, monkeypatch, dummy_ontology_path, raiser
+):
+    loader = ProntoLoaderAdapter(cache_dir=tmp_path, pickle_cache=True)
+    first = loader.load_from_file(dummy_ontology_path)
+    assert list(tmp_path.glob('dummy_ontology.*.pkl'))
+
+    # A second load must come from the pickle, not from pronto
+    monkeypatch.setattr('pronto.Ontology', raiser(TypeError('fail')))
+    second = loader.load_from_file(dummy_ontology_path)
+    assert second._ontology_id == first._ontology_id
+    assert {t.id for t in second._ontology.terms()} == {
+        t.id for t in first._ontology.terms()
+    }
+
+
+def test_pickle_cache_ignores_unreadable_pickle(tmp_path, dummy_ontology_path):
+    loader = ProntoLoaderAdapter(cache_dir=tmp_path, pickle_cache=True)
+    pickle_path = loader._pickle_path(dummy_ontology_path)
+    pickle_path.write_bytes(b'not a pickle')
+
+    ontology = loader.load_from_file(dummy_ontology_path)
+    assert next(iter(ontology._ontology.terms()), None) is not None
+    assert loader._read_pickle(pickle_path) is not None
@@ -1,61 +1,23 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
 import pytest
+import yaml
 
 from ontograph.models import (
     Ontology,
+    LookUpTables,
+    EdgesDataframe,
     CatalogOntologies,
 )
 import ontograph.models as models_module
 
 
-@pytest.fixture
-def dummy_catalog(tmp_path):
-    # Create a dummy OBO Foundry registry YAML file
-    catalog_data = {
-        'ontologies': [
-            {
-                'id': 'chebi',
-                'title': 'ChEBI',
-                'products': [
-                    {
-                        'id': 'chebi.obo',
-                        'ontology_purl': 'http://example.com/chebi.obo',
-                    },
-                    {
-                        'id': 'chebi.owl',
-                        'ontology_purl': 'http://example.com/chebi.owl',
-                    },
-                ],
-            },
-            {
-                'id': 'ado',
-                'title': 'ADO',
-                'products': [
-                    {
-                        'id': 'ado.owl',
-                        'ontology_purl': 'http://example.com/ado.owl',
-                    },
-                ],
-            },
-        ]
-    }
-    catalog_file = tmp_path / 'obofoundry_registry.yml'
-    import yaml
-
+def _write_catalog(catalog_file, catalog_data):
     with open(catalog_file, 'w') as f:
         yaml.safe_dump(catalog_data, f)
-    return catalog_file, catalog_data
-
-
-@pytest.fixture
-def catalogontologies(tmp_path, dummy_catalog, monkeypatch):
-    catalog_file, _ = dummy_catalog
-    # Monkeypatch config to use our dummy file
-    from ontograph.config import settings
-
-    monkeypatch.setattr(settings, 'NAME_OBO_FOUNDRY_CATALOG', catalog_file.name)
-    obo_reg = CatalogOntologies(cache_dir=tmp_path)
-    obo_reg.load_catalog()
-    return obo_reg
+    return catalog_file
 
 
 def test_list_available_ontologies(catalogontologies):
@@ -116,16 +78,10 @@ def test_load_catalog_uses_default_downloader(tmp_path, monkeypatch):
     catalog_file = tmp_path / 'registry.yml'
     catalog_data = {'ontologies': []}
 
-    def write_catalog():
-        import yaml
-
-        with open(catalog_file, 'w') as f:
-            yaml.safe_dump(catalog_data, f)
-
+    # Two-argument signature, as written before fetch_from_url took force
     class DummyDownloader:
         def fetch_from_url(self, url_ontology, filename):
-            write_catalog()
-            return catalog_file
+            return _write_catalog(catalog_file, catalog_data)
 
     calls = {'count': 0}
 
@@ -145,6 +101,29 @@ def test_load_catalog_uses_default_downloader(tmp_path, monkeypatch):
     assert calls['count'] == 1
 
 
+@pytest.mark.parametrize('force_download', [False, True])
+def test_load_catalog_passes_force_when_supported(
+    tmp_path, monkeypatch, force_download
+):
+    catalog_file = tmp_path / 'registry.yml'
+    received = []
+
+    class ForceAwareDownloader:
+        def fetch_from_url(self, url_ontology, filename, **options):
+            received.append(options)
+            return _write_catalog(catalog_file, {'ontologies': []})
+
+    monkeypatch.setattr(
+        models_module, 'NAME_OBO_FOUNDRY_CATALOG', catalog_file.name
+    )
+    obo_reg = CatalogOntologies(
+        cache_dir=tmp_path, downloader=ForceAwareDownloader()
+    )
+    obo_reg._download_registry(force=force_download)
+    # force is only sent when a refresh is requested
+    assert received == [{'force': True} if force_download else {}]
+
+
 def test_ontology_model():
     ontology = Ontology(
         ontology_source='dummy', ontology_id='chebi', metadata={'foo': 'bar'}
@@ -152,3 +131,66 @@ def test_ontology_model():
     assert ontology.get_ontology() == 'dummy'
     assert ontology.get_ontology_id() == 'chebi'
     assert ontology.get_metadata() == {'foo': 'bar'}
+
+
+def test_edges_dataframe(dummy_ontology):
+    terms = list(dummy_ontology.get_ontology().terms())
+    df = EdgesDataframe(terms).dataframe
+    is_a = df[df['relation'] == 'is_a']
+    assert {'D', 'K'} == set(is_a.loc[is_a['source_id'] == 'G', 'target_id'])
+    assert df['index'].tolist() == list(range(len(df)))
+    # The public dtype stays plain strings unless categoricals are requested
+    assert pd.api.types.is_string_dtype(df['relation'])
+    assert not isinstance(df['relation'].dtype, pd.CategoricalDtype)
+
+    categorical = EdgesDataframe(terms, categorical_relations=True).dataframe
+    assert isinstance(categorical['relation'].dtype, pd.CategoricalDtype)
+    assert categorical['relation'].tolist() == df['relation'].tolist()
+
+
+def test_edges_dataframe_empty():
+    df = EdgesDataframe([]).dataframe
+    assert df.empty
+    assert list(df.columns) == [
+        'index',
+        'source_id',
+        'source_name',
+        'relation',
+        'target_id',
+        'target_name',
+        'is_obsolete',
+    ]
+
+
+@pytest.mark.parametrize(
+    'indexes', [[2, 0], np.array([2, 0]), np.array([2, 0], dtype=np.int32)]
+)
+def test_lookup_tables_index_to_term(indexes):
+    terms = [SimpleNamespace(id=i, name=i.lower()) for i in ('A', 'B', 'C')]
+    lut = LookUpTables(terms)
+    assert lut.index_to_term(indexes) == ['C', 'A']
+    assert lut.index_to_term([]) == []
+    assert lut.index_to_term(1) == 'B'
+    with pytest.raises(TypeError):
+        lut.index_to_term('1')
+
+
+@pytest.mark.parametrize('indexes', [[1.7], np.array([1.0]), [1, 'A']])
+def test_lookup_tables_index_to_term_rejects_non_integers(indexes):
+    terms = [SimpleNamespace(id=i, name=i.lower()) for i in ('A', 'B', 'C')]
+    lut = LookUpTables(terms)
+    with pytest.raises(TypeError):
+        lut.index_to_term(indexes)
+
+
+def test_lookup_tables_mappings():
+    terms = [SimpleNamespace(id=i, name=i.lower()) for i in ('A', 'B', 'C')]
+    lut = LookUpTables(terms)
+    assert lut.get_lut_term_to_index() == {'A': 0, 'B': 1, 'C': 2}
+    assert lut.get_lut_index_to_term() == ['A', 'B', 'C']
+    assert lut.term_to_description(['C', 'A']) == ['c', 'a']
+    assert lut.description_to_term('b') == 'B'
+    assert lut.term_to_index(['C', 'A']) == [2, 0]
+    assert lut.description_to_term(['b', 'c']) == ['B', 'C']
+    with pytest.raises(KeyError):
+        lut.term_to_index(['A', 'missing'])
@@ -0,0 +1,46 @@
+import functools
+
+import pytest
+
+from ontograph.queries.navigator import NavigatorPronto
+from ontograph.queries.relations import RelationsPronto
+from ontograph.queries.introspection import IntrospectionPronto
+
+
+# -----------------------------------
+# ----      PyTest Fixtures      ----
+# -----------------------------------
+@pytest.fixture(scope='session')
+def dummy_navigator(dummy_ontology):
+    navigator = NavigatorPronto(dummy_ontology)
+    # get_root() scans every term; the shared ontology never changes, so
+    # scan once. Tests patching get_root replace this wrapper wholesale.
+    navigator.get_root = functools.lru_cache(maxsize=1)(navigator.get_root)
+    return navigator
+
+
+@pytest.fixture(scope='session')
+def dummy_relations(dummy_navigator):
+    return RelationsPronto(dummy_navigator)
+
+
+@pytest.fixture(scope='session')
+def dummy_introspection(dummy_navigator, dummy_relations):
+    return IntrospectionPronto(dummy_navigator, dummy_relations)
+
+
+@pytest.fixture
+def raising(monkeypatch, raiser):
+    """Make a query object's wrapped navigator method raise ``exc``.
+
+    Resolves the name-mangled ``_<ClassName>__navigator`` attribute so
+    tests need not spell it out.
+    """
+
+    def _apply(query, method, exc=None):
+        navigator = getattr(query, f'_{type(query).__name__}__navigator')
+        monkeypatch.setattr(
+            navigator, method, raiser(exc or RuntimeError('fail'))
+        )
+
+    return _apply
@@ -1,50 +1,18 @@
-from pathlib import Path
+from dataclasses import field, dataclass
 
 import pytest
 
-from ontograph.loader import ProntoLoaderAdapter
-from ontograph.queries.navigator import NavigatorPronto
-from ontograph.queries.relations import RelationsPronto
 from ontograph.queries.introspection import IntrospectionPronto
 
 
-# -----------------------------------
-# ----      PyTest Fixtures      ----
-# -----------------------------------
-@pytest.fixture
-def dummy_ontology(tmp_path):
-    resources_dir = Path(__file__).parent.parent / 'resources'
-    if not resources_dir.exists():
-        raise FileNotFoundError(
-            f'Resource directory does not exist: {resources_dir}'
-        )
-
-    obo_path = resources_dir / 'dummy_ontology.obo'
-    if not obo_path.exists():
-        raise FileNotFoundError(f'Ontology file not found: {obo_path}')
-
-    try:
-        loader = ProntoLoaderAdapter(cache_dir=resources_dir)
-        ontology = loader.load_from_file(file_path_ontology=obo_path)
-    except Exception as e:
-        raise RuntimeError(f'Failed to load ontology from {obo_path}') from e
-
-    return ontology
-
-
-@pytest.fixture
-def dummy_navigator(dummy_ontology):
-    return NavigatorPronto(dummy_ontology)
-
-
-@pytest.fixture
-def dummy_relations(dummy_navigator):
-    return RelationsPronto(dummy_navigator)
+@dataclass(slots=True)
+class _TreeNode:
+    """Minimal tree node accepted by ``_print_ascii_tree``."""
 
-
-@pytest.fixture
-def dummy_introspection(dummy_navigator, dummy_relations):
-    return IntrospectionPronto(dummy_navigator, dummy_relations)
+    id: str
+    name: str
+    distance: int
+    children: dict = field(default_factory=dict)
 
 
 # -----------------------------------
@@ -60,14 +28,14 @@ def test_get_distance_from_root_root_term(dummy_introspection, dummy_navigator):
     assert distance == 0
 
 
+@pytest.mark.parametrize(
+    ('term_id', 'expected'),
+    [('C', 1), ('D', 2), ('F', 3), ('Z', 0)],
+)
 def test_get_distance_from_root_direct_child(
-    dummy_introspection, dummy_navigator
+    dummy_introspection, term_id, expected
 ):
-    # Pick a direct child of root and check its distance is 1
-    assert dummy_introspection.get_distance_from_root('C') == 1
-    assert dummy_introspection.get_distance_from_root('D') == 2
-    assert dummy_introspection.get_distance_from_root('F') == 3
-    assert dummy_introspection.get_distance_from_root('Z') == 0
+    assert dummy_introspection.get_distance_from_root(term_id) == expected
 
 
 def test_get_distance_from_root_nonexistent_term(dummy_introspection):
@@ -192,16 +160,9 @@ def test_build_tree_from_trajectories_structure():
 
 
 def test_print_ascii_tree(capsys):
-    class Node:
-        def __init__(self, node_id, name, distance):
-            self.id = node_id
-            self.name = name
-            self.distance = distance
-            self.children = {}
-
-    root = Node('Z', 'root', 0)
-    root.children[('A', 'A', 1)] = Node('A', 'A', 1)
-    root.children[('B', 'B', 1)] = Node('B', 'B', 1)
+    root = _TreeNode('Z', 'root', 0)
+    root.children[('A', 'A', 1)] = _TreeNode('A', 'A', 1)
+    root.children[('B', 'B', 1)] = _TreeNode('B', 'B', 1)
     IntrospectionPronto._print_ascii_tree(root)
     out, _ = capsys.readouterr()
     assert 'Z: root' in out
@@ -209,17 +170,8 @@ def test_print_ascii_tree(capsys):
     assert 'B: B' in out
 
 
-def test_get_distance_from_root_term_exception(
-    dummy_introspection, monkeypatch
-):
-    def raise_exc(term_id):
-        raise RuntimeError('Term not found')
-
-    monkeypatch.setattr(
-        dummy_introspection._IntrospectionPronto__navigator,
-        'get_term',
-        raise_exc,
-    )
+def test_get_distance_from_root_term_exception(dummy_introspection, raising):
+    raising(dummy_introspection, 'get_term', RuntimeError('Term not found'))
     with pytest.raises(RuntimeError):
         dummy_introspection.get_distance_from_root('X')
 
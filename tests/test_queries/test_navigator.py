@@ -1,36 +1,50 @@
-from pathlib import Path
+import sys
 
 import pytest
 
-from ontograph.loader import ProntoLoaderAdapter
+import ontograph.queries.navigator as navigator_module
 from ontograph.queries.navigator import NavigatorPronto
 
+# Expected neighbourhoods in dummy_ontology.obo
+_PARENTS_G = frozenset({'D', 'K'})
+_CHILDREN_G = frozenset({'K1', 'K2'})
+_CHILDREN_D = frozenset({'E', 'F', 'G'})
+_SIBLINGS_G = frozenset({'E', 'F', 'Q'})
+_SIBLINGS_Y = frozenset({'O'})
+_PARENTS_G_WITH_SELF = _PARENTS_G | {'G'}
+_CHILDREN_D_WITH_SELF = _CHILDREN_D | {'D'}
+_SIBLINGS_Y_WITH_SELF = _SIBLINGS_Y | {'Y'}
+_ANCESTORS_G = frozenset({'D', 'A', 'Z', 'K', 'H', 'B'})
+_ANCESTORS_G_WITH_SELF = _ANCESTORS_G | {'G'}
+_ANCESTORS_G_DIST_2 = frozenset({'D', 'A', 'K', 'H'})
+_ANCESTORS_F_DIST = frozenset({('F', 0), ('D', -1), ('A', -2), ('Z', -3)})
+_DESCENDANTS_B = frozenset({'H', 'K', 'Q', 'G', 'K1', 'K2', 'I', 'L'})
+_DESCENDANTS_B_WITH_SELF = _DESCENDANTS_B | {'B'}
+_CHILDREN_B = frozenset({'H', 'I'})
+_DESCENDANTS_M_DIST_2 = frozenset({'S', 'T'})
+_DESCENDANTS_B_DIST = frozenset(
+    {
+        ('B', 0),
+        ('H', 1),
+        ('I', 1),
+        ('K', 2),
+        ('L', 2),
+        ('Q', 3),
+        ('G', 3),
+        ('K1', 4),
+        ('K2', 4),
+    }
+)
 
-# -----------------------------------
-# ----      PyTest Fixtures      ----
-# -----------------------------------
-@pytest.fixture
-def dummy_ontology(tmp_path):
-    resources_dir = Path(__file__).parent.parent / 'resources'
-    if not resources_dir.exists():
-        raise FileNotFoundError(
-            f'Resource directory does not exist: {resources_dir}'
-        )
-
-    obo_path = resources_dir / 'dummy_ontology.obo'
-    if not obo_path.exists():
-        raise FileNotFoundError(f'Ontology file not found: {obo_path}')
-
-    try:
-        loader = ProntoLoaderAdapter(cache_dir=resources_dir)
-        ontology = loader.load_from_file(file_path_ontology=obo_path)
-    except Exception as e:
-        raise RuntimeError(f'Failed to load ontology from {obo_path}') from e
 
-    return ontology
+def _raise_runtime(*args, **kwargs):
+    raise RuntimeError('fail')
 
 
-@pytest.fixture
+# -----------------------------------
+# ----      PyTest Fixtures      ----
+# -----------------------------------
+@pytest.fixture(scope='session')
 def navigator(dummy_ontology):
     return NavigatorPronto(dummy_ontology)
 
@@ -51,22 +65,43 @@ def test_get_term_invalid_id_raises(navigator):
         navigator.get_term('NON_EXISTENT_ID')
 
 
+# ---- Unknown term IDs
+@pytest.mark.parametrize(
+    ('method', 'expected'),
+    [
+        ('get_children', []),
+        ('get_ancestors', []),
+        ('get_descendants', set()),
+        ('get_siblings', set()),
+    ],
+)
+def test_invalid_id_returns_empty(navigator, method, expected):
+    assert getattr(navigator, method)('NON_EXISTENT_ID') == expected
+
+
+@pytest.mark.parametrize(
+    'method',
+    ['get_ancestors_with_distance', 'get_descendants_with_distance'],
+)
+def test_with_distance_invalid_id_yields_nothing(navigator, method):
+    assert list(getattr(navigator, method)('NON_EXISTENT_ID')) == []
+
+
 # ---- Function: get_parents()
 def test_get_parents(navigator):
-    assert set(navigator.get_parents(term_id='G', include_self=False)) == {
-        'D',
-        'K',
-    }
+    parents = navigator.get_parents(term_id='G', include_self=False)
+    assert set(parents) == _PARENTS_G
 
 
 def test_get_parents_include_self(navigator):
-    assert set(navigator.get_parents('G', include_self=True)) == {'G', 'D', 'K'}
+    parents = navigator.get_parents('G', include_self=True)
+    assert set(parents) == _PARENTS_G_WITH_SELF
 
 
 # ---- Function: get_children()
 def test_get_children_basic(navigator):
     children = navigator.get_children('G')
-    assert set(children) == {'K1', 'K2'}
+    assert set(children) == _CHILDREN_G
 
 
 def test_get_children_no_children(navigator):
@@ -80,39 +115,32 @@ def test_get_children_include_self(navigator):
     # Assuming "B" has child "D" in dummy_ontology
     children = navigator.get_children('D', include_self=True)
     # Should include "B" itself if present in children
-    assert set(children) == {'D', 'E', 'F', 'G'}
-
-
-def test_get_children_invalid_id(navigator):
-    children = navigator.get_children('NON_EXISTENT_ID')
-    assert children == []
+    assert set(children) == _CHILDREN_D_WITH_SELF
 
 
 # ---- Function: get_ancestors()
 def test_get_ancestors_basic(navigator):
     # "G" should have ancestors "D" and "K"
     ancestors = navigator.get_ancestors('G')
-    assert set(ancestors) == {'D', 'A', 'Z', 'K', 'H', 'B'}
+    assert frozenset(ancestors) == _ANCESTORS_G
 
 
 def test_get_ancestors_include_self(navigator):
     # Including self should add "G" to the ancestors
     ancestors = navigator.get_ancestors('G', include_self=True)
-    assert set(ancestors) == {'G', 'D', 'A', 'Z', 'K', 'H', 'B'}
+    assert frozenset(ancestors) == _ANCESTORS_G_WITH_SELF
 
 
 def test_get_ancestors_distance_1(navigator):
     # Distance 1 should only return direct parents
     ancestors = navigator.get_ancestors('G', distance=1)
-    assert set(ancestors) == {'D', 'K'}
+    assert frozenset(ancestors) == _PARENTS_G
 
 
 def test_get_ancestors_distance_2(navigator):
     # Distance 2 should return parents and their parents
     ancestors = navigator.get_ancestors('G', distance=2)
-    # The expected set depends on dummy_ontology structure
-    # Example: {"D", "K", "B", "E"} if those are at distance 2
-    assert set(ancestors) == {'D', 'A', 'K', 'H'}
+    assert frozenset(ancestors) == _ANCESTORS_G_DIST_2
 
 
 def test_get_ancestors_no_ancestors(navigator):
@@ -121,11 +149,6 @@ def test_get_ancestors_no_ancestors(navigator):
     assert ancestors == []
 
 
-def test_get_ancestors_invalid_id(navigator):
-    ancestors = navigator.get_ancestors('NON_EXISTENT_ID')
-    assert ancestors == []
-
-
 # ---- Function: get_ancestors_with_distance()
 def test_get_ancestors_with_distance_basic(navigator):
     # "F" should have ancestors with their distances
@@ -135,14 +158,7 @@ def test_get_ancestors_with_distance_basic(navigator):
     )
     ids_and_distances = {(term.id, dist) for term, dist in results}
 
-    expected_ids_and_distances = {
-        ('F', 0),
-        ('D', -1),
-        ('A', -2),
-        ('Z', -3),
-    }
-
-    assert ids_and_distances == expected_ids_and_distances
+    assert ids_and_distances == _ANCESTORS_F_DIST
     assert ('F', 0) in ids_and_distances
 
 
@@ -169,37 +185,29 @@ def test_get_ancestors_with_distance_root_term(navigator):
     assert ids_and_distances == {('Z', 0)}
 
 
-def test_get_ancestors_with_distance_invalid_id(navigator):
-    results = list(navigator.get_ancestors_with_distance('NON_EXISTENT_ID'))
-    assert results == []
-
-
 # ---- Function: get_descendants()
 def test_get_descendants_basic(navigator):
     # "B" should have descendants "H" and "I"
     descendants = navigator.get_descendants('B')
-    assert set(descendants) == {'H', 'K', 'Q', 'G', 'K1', 'K2', 'I', 'L'}
+    assert frozenset(descendants) == _DESCENDANTS_B
 
 
 def test_get_descendants_include_self(navigator):
     # Including self should add "B" to the descendants
     descendants = navigator.get_descendants('B', include_self=True)
-    assert set(descendants) == {'B', 'H', 'K', 'Q', 'G', 'K1', 'K2', 'I', 'L'}
+    assert frozenset(descendants) == _DESCENDANTS_B_WITH_SELF
 
 
 def test_get_descendants_distance_1(navigator):
     # Distance 1 should only return direct children
     descendants = navigator.get_descendants('B', distance=1)
-    assert set(descendants) == {'H', 'I'}
+    assert frozenset(descendants) == _CHILDREN_B
 
 
 def test_get_descendants_distance_2(navigator):
     # Distance 2 should include children and their children
     descendants = navigator.get_descendants('M', distance=2)
-    # The expected set depends on dummy_ontology structure
-    # Example: {"S", "T"} if those exist
-
-    assert set(descendants) == {'S', 'T'}  # At least direct children
+    assert frozenset(descendants) == _DESCENDANTS_M_DIST_2
 
 
 def test_get_descendants_no_descendants(navigator):
@@ -208,9 +216,64 @@ def test_get_descendants_no_descendants(navigator):
     assert descendants == set()
 
 
-def test_get_descendants_invalid_id(navigator):
-    descendants = navigator.get_descendants('NON_EXISTENT_ID')
-    assert descendants == set()
+# ---- Cached traversals
+def test_cached_results_are_copies(dummy_ontology):
+    navigator = NavigatorPronto(dummy_ontology)
+    navigator.get_ancestors('G').append('X')
+    navigator.get_descendants('B').add('X')
+    assert frozenset(navigator.get_ancestors('G')) == _ANCESTORS_G
+    assert frozenset(navigator.get_descendants('B')) == _DESCENDANTS_B
+
+
+def test_cache_keys_on_arguments(navigator):
+    assert frozenset(navigator.get_ancestors('G', distance=1)) == _PARENTS_G
+    assert frozenset(navigator.get_ancestors('G')) == _ANCESTORS_G
+    assert frozenset(navigator.get_descendants('B', distance=1)) == _CHILDREN_B
+    assert frozenset(navigator.get_descendants('B')) == _DESCENDANTS_B
+
+
+def test_cache_is_bounded(dummy_ontology, monkeypatch):
+    monkeypatch.setattr(navigator_module, '_TRAVERSAL_CACHE_SIZE', 2)
+    navigator = NavigatorPronto(dummy_ontology)
+    for term_id in ('G', 'F', 'K1'):
+        navigator.get_ancestors(term_id)
+    cache = navigator._NavigatorPronto__ancestors_cache
+    assert [key[0] for key in cache] == ['F', 'K1']
+
+    # A hit refreshes the entry, so the least recently used one goes
+    navigator.get_ancestors('F')
+    navigator.get_ancestors('G')
+    assert [key[0] for key in cache] == ['F', 'G']
+
+
+def test_cache_checks_term_before_lookup(dummy_ontology, monkeypatch, raiser):
+    navigator = NavigatorPronto(dummy_ontology)
+    navigator.get_ancestors('G')
+    navigator.get_descendants('B')
+    monkeypatch.setattr(navigator, 'get_term', raiser(KeyError('G')))
+    assert navigator.get_ancestors('G') == []
+    assert navigator.get_descendants('B') == set()
+
+
+def test_clear_cache(dummy_ontology):
+    navigator = NavigatorPronto(dummy_ontology)
+    navigator.get_ancestors('G')
+    navigator.get_descendants('B')
+    navigator.clear_cache()
+    assert not navigator._NavigatorPronto__ancestors_cache
+    assert not navigator._NavigatorPronto__descendants_cache
+    assert frozenset(navigator.get_ancestors('G')) == _ANCESTORS_G
+
+
+def test_clear_cache_drops_index(dummy_ontology):
+    navigator = NavigatorPronto(dummy_ontology)
+    index = navigator.build_index()
+    navigator.clear_cache()
+    assert navigator.index is None
+
+    rebuilt = navigator.build_index()
+    assert rebuilt is not index
+    assert rebuilt.ids == index.ids
 
 
 # ---- Function: get_descendants_with_distance()
@@ -219,20 +282,8 @@ def test_get_descendants_with_distance_basic(navigator):
     results = list(
         navigator.get_descendants_with_distance('B', include_self=True)
     )
-    # Example expected: ("B", 0), ("H", 1), ("I", 1), ("K", 2), ("L", 2), ("Q", 3), ("G", 3), ("K1", 4), ("K2", 4)
-    expected_ids_and_distances = {
-        ('B', 0),
-        ('H', 1),
-        ('I', 1),
-        ('K', 2),
-        ('L', 2),
-        ('Q', 3),
-        ('G', 3),
-        ('K1', 4),
-        ('K2', 4),
-    }
     ids_and_distances = {(term.id, dist) for term, dist in results}
-    assert ids_and_distances == expected_ids_and_distances
+    assert ids_and_distances == _DESCENDANTS_B_DIST
     assert ('B', 0) in ids_and_distances
     # All distances should be >= 0
     for _, dist in ids_and_distances:
@@ -260,21 +311,16 @@ def test_get_descendants_with_distance_leaf_term(navigator):
     assert ids_and_distances == {('N', 0)}
 
 
-def test_get_descendants_with_distance_invalid_id(navigator):
-    results = list(navigator.get_descendants_with_distance('NON_EXISTENT_ID'))
-    assert results == []
-
-
 # ---- Function: get_siblings()
 def test_get_siblings_basic(navigator):
     # "G" should have siblings "E", "F", "Q" (assuming parents "D" and "K")
     siblings = navigator.get_siblings('G')
-    assert set(siblings) == {'E', 'F', 'Q'}
+    assert set(siblings) == _SIBLINGS_G
 
 
 def test_get_siblings_include_self(navigator):
     siblings = navigator.get_siblings('Y', include_self=True)
-    assert set(siblings) == {'Y', 'O'}
+    assert set(siblings) == _SIBLINGS_Y_WITH_SELF
 
 
 def test_get_siblings_no_siblings(navigator):
@@ -289,9 +335,17 @@ def test_get_siblings_leaf_term(navigator):
     assert siblings == set()
 
 
-def test_get_siblings_invalid_id(navigator):
-    siblings = navigator.get_siblings('NON_EXISTENT_ID')
-    assert siblings == set()
+# ---- Function: build_index()
+def test_build_index(dummy_ontology):
+    navigator = NavigatorPronto(dummy_ontology)
+    assert navigator.index is None
+
+    index = navigator.build_index()
+    assert navigator.build_index() is index
+    assert navigator.index is index
+    assert index.ids[index.positions['G']] is sys.intern('G')
+    parents = {index.ids[pos] for pos in index.parents[index.positions['G']]}
+    assert parents == _PARENTS_G
 
 
 # ---- Function: get_root()
@@ -320,9 +374,7 @@ def test_get_root_no_roots(monkeypatch, navigator):
 def test_get_root_exception(monkeypatch, navigator):
     # Monkeypatch __ontology.terms to raise an exception
     monkeypatch.setattr(
-        navigator._NavigatorPronto__ontology,
-        'terms',
-        lambda: (_ for _ in () if False),
+        navigator._NavigatorPronto__ontology, 'terms', _raise_runtime
     )
     # Should handle exception and return []
     roots = navigator.get_root()
@@ -1,44 +1,31 @@
-from pathlib import Path
-
 import pytest
 
-from ontograph.loader import ProntoLoaderAdapter
-from ontograph.queries.navigator import NavigatorPronto
-from ontograph.queries.relations import RelationsPronto
+from ontograph.queries.navigator import TermIndex
+from ontograph.queries.relations import RelationsPronto, _topological_order
+
+# (ancestor, descendant, distance) ground truth in dummy_ontology.obo;
+# is_ancestor, is_descendant and _get_distance_to_ancestor all check it
+_ANCESTRY = [('A', 'D', 1), ('A', 'K2', 3), ('B', 'K', 2), ('S', 'U', 2)]
+# (term, other) pairs where ``term`` is not an ancestor of ``other``
+_NOT_ANCESTRY = [('D', 'A'), ('B', 'Z'), ('H', 'B'), ('K1', 'K2')]
 
 
 # -----------------------------------
 # ----      PyTest Fixtures      ----
 # -----------------------------------
-@pytest.fixture
-def dummy_ontology(tmp_path):
-    resources_dir = Path(__file__).parent.parent / 'resources'
-    if not resources_dir.exists():
-        raise FileNotFoundError(
-            f'Resource directory does not exist: {resources_dir}'
-        )
-
-    obo_path = resources_dir / 'dummy_ontology.obo'
-    if not obo_path.exists():
-        raise FileNotFoundError(f'Ontology file not found: {obo_path}')
-
-    try:
-        loader = ProntoLoaderAdapter(cache_dir=resources_dir)
-        ontology = loader.load_from_file(file_path_ontology=obo_path)
-    except Exception as e:
-        raise RuntimeError(f'Failed to load ontology from {obo_path}') from e
+@pytest.fixture(scope='module')
+def indexed_relations(dummy_navigator):
+    # Own instance: the shared one must keep exercising the traversal path
+    relations = RelationsPronto(dummy_navigator)
+    relations.build_ancestry_index()
+    return relations
 
-    return ontology
 
-
-@pytest.fixture
-def dummy_navigator(dummy_ontology):
-    return NavigatorPronto(dummy_ontology)
-
-
-@pytest.fixture
-def dummy_relations(dummy_navigator):
-    return RelationsPronto(dummy_navigator)
+@pytest.fixture(scope='module')
+def distance_relations(dummy_navigator):
+    relations = RelationsPronto(dummy_navigator)
+    relations.build_distance_table()
+    return relations
 
 
 # -----------------------------------
@@ -47,79 +34,170 @@ def dummy_relations(dummy_navigator):
 
 
 # ---- Function: is_ancestor()
-def test_is_ancestor_true(dummy_relations):
-    # These should be true in your main dummy ontology
-    assert dummy_relations.is_ancestor('A', 'D') is True
-    assert dummy_relations.is_ancestor('A', 'K2') is True
-    assert dummy_relations.is_ancestor('B', 'K') is True
-    assert dummy_relations.is_ancestor('S', 'U') is True
+@pytest.mark.parametrize(('ancestor', 'descendant', 'distance'), _ANCESTRY)
+def test_is_ancestor_true(dummy_relations, ancestor, descendant, distance):
+    assert dummy_relations.is_ancestor(ancestor, descendant) is True
 
 
-def test_is_ancestor_false(dummy_relations):
-    assert dummy_relations.is_ancestor('D', 'A') is False
-    assert dummy_relations.is_ancestor('B', 'Z') is False
-    assert dummy_relations.is_ancestor('H', 'B') is False
-    assert dummy_relations.is_ancestor('K1', 'K2') is False
+@pytest.mark.parametrize(('ancestor', 'descendant'), _NOT_ANCESTRY)
+def test_is_ancestor_false(dummy_relations, ancestor, descendant):
+    assert dummy_relations.is_ancestor(ancestor, descendant) is False
 
 
-def test_is_ancestor_self(dummy_relations):
+@pytest.mark.parametrize('term_id', ['A', 'B'])
+def test_is_ancestor_self(dummy_relations, term_id):
     # Should be False because include_self=False
-    assert dummy_relations.is_ancestor('A', 'A') is False
-    assert dummy_relations.is_ancestor('B', 'B') is False
+    assert dummy_relations.is_ancestor(term_id, term_id) is False
 
 
 def test_is_ancestor_invalid_id(dummy_relations):
     assert dummy_relations.is_ancestor('invalid', 'child') is False
 
 
-def raise_runtime_error(*a, **kw):
-    raise RuntimeError('fail')
-
-
-def test_is_ancestor_exception(dummy_relations, monkeypatch):
-    # Patch get_ancestors to raise Exception
-    # Accessing _RelationsPronto__navigator directly is intentional for testing.
-    monkeypatch.setattr(
-        dummy_relations._RelationsPronto__navigator,
-        'get_ancestors',
-        raise_runtime_error,
-    )
+def test_is_ancestor_exception(dummy_relations, raising):
+    raising(dummy_relations, 'get_ancestors')
     with pytest.raises(RuntimeError):
         dummy_relations.is_ancestor('A', 'D')
 
 
 # ---- Function: is_descendant()
-def test_is_descendant_true(dummy_relations):
-    assert dummy_relations.is_descendant('D', 'A') is True
-    assert dummy_relations.is_descendant('K2', 'A') is True
-    assert dummy_relations.is_descendant('K', 'B') is True
-    assert dummy_relations.is_descendant('U', 'S') is True
+@pytest.mark.parametrize(('ancestor', 'descendant', 'distance'), _ANCESTRY)
+def test_is_descendant_true(dummy_relations, ancestor, descendant, distance):
+    assert dummy_relations.is_descendant(descendant, ancestor) is True
 
 
-def test_is_descendant_false(dummy_relations):
-    assert dummy_relations.is_descendant('A', 'D') is False
-    assert dummy_relations.is_descendant('Z', 'B') is False
-    assert dummy_relations.is_descendant('B', 'H') is False
-    assert dummy_relations.is_descendant('K2', 'K1') is False
+@pytest.mark.parametrize(('ancestor', 'descendant'), _NOT_ANCESTRY)
+def test_is_descendant_false(dummy_relations, ancestor, descendant):
+    assert dummy_relations.is_descendant(descendant, ancestor) is False
 
 
-def test_is_descendant_self(dummy_relations):
+@pytest.mark.parametrize('term_id', ['A', 'B'])
+def test_is_descendant_self(dummy_relations, term_id):
     # Should be False because include_self=False
-    assert dummy_relations.is_descendant('A', 'A') is False
-    assert dummy_relations.is_descendant('B', 'B') is False
+    assert dummy_relations.is_descendant(term_id, term_id) is False
 
 
-def test_is_descendant_exception(dummy_relations, monkeypatch):
-    # Accessing _RelationsPronto__navigator directly is intentional for testing.
-    monkeypatch.setattr(
-        dummy_relations._RelationsPronto__navigator,
-        'get_descendants',
-        raise_runtime_error,
-    )
+def test_is_descendant_exception(dummy_relations, raising):
+    raising(dummy_relations, 'get_descendants')
     with pytest.raises(RuntimeError):
         dummy_relations.is_descendant('D', 'A')
 
 
+# ---- Function: build_ancestry_index()
+@pytest.mark.parametrize(('ancestor', 'descendant', 'distance'), _ANCESTRY)
+def test_ancestry_index_true(indexed_relations, ancestor, descendant, distance):
+    assert indexed_relations.is_ancestor(ancestor, descendant) is True
+    assert indexed_relations.is_descendant(descendant, ancestor) is True
+
+
+@pytest.mark.parametrize(('ancestor', 'descendant'), _NOT_ANCESTRY)
+def test_ancestry_index_false(indexed_relations, ancestor, descendant):
+    assert indexed_relations.is_ancestor(ancestor, descendant) is False
+    assert indexed_relations.is_descendant(descendant, ancestor) is False
+
+
+@pytest.mark.parametrize(('node_a', 'node_b'), [('A', 'A'), ('invalid', 'D')])
+def test_ancestry_index_self_and_unknown(indexed_relations, node_a, node_b):
+    assert indexed_relations.is_ancestor(node_a, node_b) is False
+    assert indexed_relations.is_descendant(node_b, node_a) is False
+
+
+def test_ancestry_index_matches_traversal(indexed_relations, dummy_relations):
+    ids = indexed_relations._RelationsPronto__navigator.index.ids
+    for ancestor in ids:
+        for descendant in ids:
+            assert indexed_relations.is_ancestor(
+                ancestor, descendant
+            ) == dummy_relations.is_ancestor(ancestor, descendant)
+
+
+@pytest.mark.parametrize(
+    'node_ids',
+    [['K1', 'K2'], ['A'], ['A', 'Z'], ['N', 'O', 'G'], ['A', 'invalid'], []],
+)
+def test_ancestry_index_common_ancestors(
+    indexed_relations, dummy_relations, node_ids
+):
+    assert indexed_relations.get_common_ancestors(
+        node_ids
+    ) == dummy_relations.get_common_ancestors(node_ids)
+
+
+@pytest.mark.parametrize(
+    ('node_a', 'node_b'),
+    [
+        ('K1', 'K2'),
+        ('F', 'E'),
+        ('W', 'V'),
+        ('A', 'A'),
+        ('A', 'K1'),
+        ('B', 'Z'),
+        ('K', 'L'),
+        ('invalid', 'A'),
+    ],
+)
+def test_ancestry_index_is_sibling(
+    indexed_relations, dummy_relations, node_a, node_b
+):
+    assert indexed_relations.is_sibling(
+        node_a, node_b
+    ) == dummy_relations.is_sibling(node_a, node_b)
+
+
+@pytest.mark.parametrize(
+    ('ancestor', 'descendant'),
+    [(a, d) for a, d, _ in _ANCESTRY]
+    + [*_NOT_ANCESTRY, ('A', 'A'), ('x', 'A')],
+)
+def test_ancestry_index_distance_to_ancestor(
+    indexed_relations, dummy_relations, ancestor, descendant
+):
+    assert indexed_relations._get_distance_to_ancestor(
+        descendant, ancestor
+    ) == dummy_relations._get_distance_to_ancestor(descendant, ancestor)
+
+
+def test_ancestry_index_distance_unknown_node(indexed_relations):
+    with pytest.raises(KeyError):
+        indexed_relations._get_distance_to_ancestor('invalid', 'A')
+
+
+def test_distance_table_matches_traversal(distance_relations, dummy_relations):
+    ids = distance_relations._RelationsPronto__navigator.index.ids
+    for node in ids:
+        assert distance_relations._get_ancestor_distances(
+            node
+        ) == dummy_relations._get_ancestor_distances(node)
+        for ancestor in [*ids, 'invalid']:
+            assert distance_relations._get_distance_to_ancestor(
+                node, ancestor
+            ) == dummy_relations._get_distance_to_ancestor(node, ancestor)
+
+
+@pytest.mark.parametrize(
+    'node_ids', [['K1', 'K2'], ['A'], ['N', 'O', 'G'], ['F', 'G']]
+)
+def test_distance_table_lowest_common_ancestors(
+    distance_relations, dummy_relations, node_ids
+):
+    assert distance_relations.get_lowest_common_ancestors(
+        node_ids
+    ) == dummy_relations.get_lowest_common_ancestors(node_ids)
+
+
+def test_distance_table_max_terms(dummy_navigator):
+    with pytest.raises(ValueError, match='limited to 1 terms'):
+        RelationsPronto(dummy_navigator).build_distance_table(max_terms=1)
+
+
+def test_topological_order_rejects_cycle():
+    index = TermIndex(
+        ids=['A', 'B'], positions={'A': 0, 'B': 1}, parents=[(1,), (0,)]
+    )
+    with pytest.raises(ValueError, match='cycle'):
+        _topological_order(index)
+
+
 # ---- Function: is_sibling()
 def test_is_sibling_true(dummy_relations):
     # These should be siblings (share at least one parent, not the same node)
@@ -203,12 +281,8 @@ def test_get_common_ancestors_multiple_nodes(dummy_relations):
     assert 'Z' in result
 
 
-def test_get_common_ancestors_outer_exception(dummy_relations, monkeypatch):
-    monkeypatch.setattr(
-        dummy_relations._RelationsPronto__navigator,
-        'get_ancestors',
-        lambda *a, **kw: (_ for _ in ()).throw(RuntimeError('fail')),
-    )
+def test_get_common_ancestors_outer_exception(dummy_relations, raising):
+    raising(dummy_relations, 'get_ancestors')
     with pytest.raises(RuntimeError):
         dummy_relations.get_common_ancestors(['A', 'B'])
 
@@ -263,30 +337,90 @@ def test_get_lowest_common_ancestors_multiple_nodes(dummy_relations):
 
 
 # ---- Function: get_distance_to_ancestor()
-def test_get_distance_to_ancestor_basic(dummy_relations):
-    # Basic distance checks
-    assert dummy_relations._get_distance_to_ancestor('D', 'A') == 1
-    assert dummy_relations._get_distance_to_ancestor('K2', 'A') == 3
-    assert dummy_relations._get_distance_to_ancestor('K', 'B') == 2
-    assert dummy_relations._get_distance_to_ancestor('U', 'S') == 2
+@pytest.mark.parametrize(('ancestor', 'descendant', 'distance'), _ANCESTRY)
+def test_get_distance_to_ancestor_basic(
+    dummy_relations, ancestor, descendant, distance
+):
+    assert (
+        dummy_relations._get_distance_to_ancestor(descendant, ancestor)
+        == distance
+    )
 
 
-def test_get_distance_to_ancestor_no_ancestor(dummy_relations):
+@pytest.mark.parametrize(
+    ('ancestor', 'descendant'), [*_NOT_ANCESTRY, ('C', 'A')]
+)
+def test_get_distance_to_ancestor_no_ancestor(
+    dummy_relations, ancestor, descendant
+):
     # No ancestor relationship
-    assert dummy_relations._get_distance_to_ancestor('A', 'C') == float('inf')
+    assert dummy_relations._get_distance_to_ancestor(
+        descendant, ancestor
+    ) == float('inf')
 
 
-def test_get_distance_to_ancestor_self(dummy_relations):
-    # Distance to self should be 0
-    assert dummy_relations._get_distance_to_ancestor('A', 'A') == 0
+@pytest.mark.parametrize(('ancestor', 'descendant', 'distance'), _ANCESTRY)
+def test_get_ancestor_distances(
+    dummy_relations, ancestor, descendant, distance
+):
+    distances = dummy_relations._get_ancestor_distances(descendant)
+    assert distances[descendant] == 0
+    assert distances[ancestor] == distance
+    # Agrees with the single-target search for every ancestor found
+    for term_id, dist in distances.items():
+        assert (
+            dummy_relations._get_distance_to_ancestor(descendant, term_id)
+            == dist
+        )
+
+
+def test_get_ancestor_distances_root(dummy_relations):
+    # A root term has no ancestors, only itself at distance 0
+    assert dummy_relations._get_ancestor_distances('Z') == {'Z': 0}
+    assert dummy_relations.get_lowest_common_ancestors(['Z']) == {'Z'}
+
+
+def test_get_ancestor_distances_unknown_term(dummy_relations):
+    with pytest.raises(KeyError):
+        dummy_relations._get_ancestor_distances('invalid')
+    # No common ancestors with an unknown term, as before the per-node search
+    with pytest.raises(ValueError):
+        dummy_relations.get_lowest_common_ancestors(['A', 'invalid'])
+
 
+def test_get_ancestor_distances_exception(dummy_relations, raising):
+    raising(dummy_relations, 'get_term')
+    with pytest.raises(RuntimeError):
+        dummy_relations._get_ancestor_distances('A')
+    with pytest.raises(RuntimeError):
+        dummy_relations.get_lowest_common_ancestors(['K1', 'K2'])
+
+
+def test_get_ancestor_distances_traversal_exception(
+    dummy_relations, monkeypatch
+):
+    class DummyTerm:
+        id = 'A'
+
+        def superclasses(self, distance=1, with_self=False):
+            raise RuntimeError('fail')
 
-def test_get_distance_to_ancestor_exception(dummy_relations, monkeypatch):
     monkeypatch.setattr(
         dummy_relations._RelationsPronto__navigator,
         'get_term',
-        lambda x: (_ for _ in ()).throw(RuntimeError('fail')),
+        lambda x: DummyTerm(),
     )
+    with pytest.raises(RuntimeError):
+        dummy_relations._get_ancestor_distances('A')
+
+
+def test_get_distance_to_ancestor_self(dummy_relations):
+    # Distance to self should be 0
+    assert dummy_relations._get_distance_to_ancestor('A', 'A') == 0
+
+
+def test_get_distance_to_ancestor_exception(dummy_relations, raising):
+    raising(dummy_relations, 'get_term')
     with pytest.raises(RuntimeError):
         dummy_relations._get_distance_to_ancestor('A', 'Z')
 